@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from abc import ABC, abstractmethod
+from abc import ABC
 from datetime import timedelta
 from typing import Any, Awaitable, Callable, Dict, Optional
 
@@ -32,6 +32,9 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class BasePikComfortEntity(Entity, ABC):
+    # Set once by subclasses; identifiers do not change over entity lifetime
+    _unique_id: str
+
     def __init__(
         self, config_entry_id: str, account_type: str, account_id: str
     ) -> None:
@@ -50,12 +53,7 @@ class BasePikComfortEntity(Entity, ABC):
         if info is None:
             return None
 
-        key = (self.account_id, self.account_type)
-        for account in info.accounts:
-            if (account.id, account.type) == key:
-                return account
-
-        return None
+        return info.get_account(self.account_type, self.account_id)
 
     @property
     def device_info(self) -> Dict[str, Any]:
@@ -78,9 +76,8 @@ class BasePikComfortEntity(Entity, ABC):
         return device_info
 
     @property
-    @abstractmethod
     def unique_id(self) -> str:
-        raise NotImplementedError
+        return self._unique_id
 
     @property
     def api_object(self) -> PikComfortAPI:
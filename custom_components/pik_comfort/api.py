@@ -1,19 +1,25 @@
 import asyncio
 import logging
-import random
-import string
+import os
+import secrets
 from abc import ABC, abstractmethod
+from base64 import b32encode
 from datetime import date, datetime
 from enum import IntEnum
+from functools import lru_cache, partial
+from operator import attrgetter, itemgetter
 from typing import (
     Any,
+    Awaitable,
+    Callable,
     ClassVar,
+    Dict,
     Final,
+    Hashable,
     Iterable,
     List,
     Mapping,
     Optional,
-    Set,
     Tuple,
     Type,
     TypeVar,
@@ -23,22 +29,51 @@ from typing import (
 import aiohttp
 import attr
 from multidict import CIMultiDict
-from pytz import timezone
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    # Python 3.8 (Home Assistant 2021.4)
+    from backports.zoneinfo import ZoneInfo
+
+try:
+    # Home Assistant ships orjson; fall back to stdlib when used standalone
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_TModel = TypeVar("_TModel", bound="_BaseListedModel")
 
 DEFAULT_SDK_VERSION: Final = 30
 DEFAULT_VERSION_NAME: Final = "1.10.0"
 DEFAULT_VERSION_CODE: Final = 81
 
-MOSCOW_TIMEZONE: Final = timezone("Europe/Moscow")
+MOSCOW_TIMEZONE: Final = ZoneInfo("Europe/Moscow")
 
 
 def get_random_device_name() -> str:
-    return "".join(
-        random.choices(string.ascii_uppercase + string.digits, k=random.randint(4, 8))
-    )
+    # 5 random bytes encode into exactly 8 base32 characters (A-Z, 2-7)
+    return b32encode(os.urandom(5)).decode()[: 4 + secrets.randbelow(5)]
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    # API responses repeat the same timestamps across refreshes
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> date:
+    return _parse_iso_datetime(value).date()
+
+
+@lru_cache(maxsize=1024)
+def _shared_tuple(value: Tuple[_T, ...]) -> Tuple[_T, ...]:
+    # Equal tuples (e.g. attachment tag sets) resolve to a single shared object
+    return value
 
 
 class PikComfortException(Exception):
@@ -88,6 +123,10 @@ class PikComfortAPI:
 
         self._user_id: Optional[str] = None
         self._classifiers: Optional[List[TicketClassifier]] = None
+        self._classifiers_by_id: Dict[str, TicketClassifier] = {}
+        self._classifiers_by_parent: Dict[str, List[TicketClassifier]] = {}
+
+        self._inflight_requests: Dict[str, asyncio.Task] = {}
 
         self._session = aiohttp.ClientSession(
             headers={
@@ -179,7 +218,7 @@ class PikComfortAPI:
                 response_status = response.status
                 if expected_status is not None and response_status != expected_status:
                     try:
-                        response_contents = await response.json()
+                        response_contents = await response.json(loads=_json_loads)
                     except aiohttp.ClientError:
                         response_contents = await response.text()
                     else:
@@ -215,7 +254,7 @@ class PikComfortAPI:
                         f"({response.status}): {response_contents}"
                     )
 
-                response_data = await response.json()
+                response_data = await response.json(loads=_json_loads)
 
         except aiohttp.ClientError as error:
             _LOGGER.error(f"[{self}] Error performing {action_title}: {error}")
@@ -285,7 +324,37 @@ class PikComfortAPI:
             self._user_id = user_id
             self.token = token
 
+    async def _async_coalesced(
+        self, key: str, async_factory: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Share a single in-flight request between concurrent callers.
+
+        :param key: Request kind identifier
+        :param async_factory: Coroutine function performing the request
+        :return: Result of the (possibly shared) request
+        """
+        inflight = self._inflight_requests.get(key)
+        if inflight is None:
+            # Request runs as a task of its own, so cancelling any single
+            # caller (including the one that started it) leaves it running
+            inflight = asyncio.ensure_future(async_factory())
+            self._inflight_requests[key] = inflight
+            inflight.add_done_callback(partial(self._forget_inflight_request, key))
+
+        return await asyncio.shield(inflight)
+
+    def _forget_inflight_request(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight_requests.get(key) is task:
+            del self._inflight_requests[key]
+
+        # Mark exception as retrieved in case all callers were cancelled
+        if not task.cancelled():
+            task.exception()
+
     async def async_update_info(self) -> "InfoResult":
+        return await self._async_coalesced("info", self._async_update_info)
+
+    async def _async_update_info(self) -> "InfoResult":
         response_data = await self.async_request(
             "/api/v8/aggregate/dashboard-list/",
             params={"tickets_size": "10"},
@@ -313,7 +382,21 @@ class PikComfortAPI:
 
         return info_object
 
+    async def async_validate_token(self) -> None:
+        # Smallest authenticated response available; models are left untouched
+        await self.async_request(
+            "/api/v3/classifier-list/",
+            params={"page_size": 1},
+            action_title="token validation",
+            authenticated=True,
+        )
+
     async def async_update_classifiers(self) -> List["TicketClassifier"]:
+        return await self._async_coalesced(
+            "classifiers", self._async_update_classifiers
+        )
+
+    async def _async_update_classifiers(self) -> List["TicketClassifier"]:
         response_data = await self.async_request(
             "/api/v3/classifier-list/",
             params={"page_size": 500},
@@ -332,8 +415,32 @@ class PikComfortAPI:
                 current_classifiers, response_data["results"], self
             )
 
+        self._rebuild_classifier_indices()
+
         return current_classifiers
 
+    def _rebuild_classifier_indices(self) -> None:
+        classifiers_by_id = {}
+        classifiers_by_parent = {}
+
+        for classifier in self._classifiers or ():
+            classifiers_by_id[classifier.id] = classifier
+            if classifier.parent_id:
+                classifiers_by_parent.setdefault(classifier.parent_id, []).append(
+                    classifier
+                )
+
+        self._classifiers_by_id = classifiers_by_id
+        self._classifiers_by_parent = classifiers_by_parent
+
+    def get_classifier(self, classifier_id: str) -> Optional["TicketClassifier"]:
+        return self._classifiers_by_id.get(classifier_id)
+
+    def get_child_classifiers(
+        self, classifier_id: str
+    ) -> Tuple["TicketClassifier", ...]:
+        return tuple(self._classifiers_by_parent.get(classifier_id, ()))
+
     async def async_create_ticket(
         self,
         classifier_id: str,
@@ -366,16 +473,10 @@ class PikComfortAPI:
                     raise PikComfortException("No matching account within info")
 
         if check_classifier:
-            classifiers = self._classifiers
-            if classifiers is None:
+            if self._classifiers is None:
                 raise PikComfortException("Classifiers must be updated")
 
-            found_classifier = None
-            for classifier in classifiers:
-                if classifier.id == classifier_id:
-                    found_classifier = classifier
-                    break
-
+            found_classifier = self.get_classifier(classifier_id)
             if found_classifier is None:
                 raise PikComfortException("Classifier was not found")
 
@@ -411,10 +512,52 @@ class PikComfortAPI:
         )
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class _BaseModel(ABC):
     api: PikComfortAPI = attr.ib(repr=False)
 
+    # (attribute, JSON key) pairs copied verbatim from JSON data
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+    _json_attributes: ClassVar[Tuple[str, ...]] = ()
+    _json_values_getter: ClassVar[Callable[[Mapping[str, Any]], Tuple[Any, ...]]]
+    # (attribute, JSON key) pairs for keys that may be absent (None by default)
+    _JSON_OPTIONAL_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        attributes = tuple(attribute for attribute, _ in cls._JSON_FIELDS)
+        keys = tuple(key for _, key in cls._JSON_FIELDS)
+
+        cls._json_attributes = attributes
+        if len(keys) > 1:
+            # Fetch all values within a single C-level call
+            cls._json_values_getter = itemgetter(*keys)
+        else:
+            cls._json_values_getter = staticmethod(
+                lambda json_data: tuple(json_data[key] for key in keys)
+            )
+
+    @classmethod
+    def _get_json_kwargs(cls, json_data: Mapping[str, Any]) -> Dict[str, Any]:
+        kwargs = dict(zip(cls._json_attributes, cls._json_values_getter(json_data)))
+
+        get = json_data.get
+        for attribute, key in cls._JSON_OPTIONAL_FIELDS:
+            kwargs[attribute] = get(key)
+
+        return kwargs
+
+    def _bulk_apply(self, json_data: Mapping[str, Any]) -> None:
+        for attribute, value in zip(
+            self._json_attributes, self._json_values_getter(json_data)
+        ):
+            setattr(self, attribute, value)
+
+        get = json_data.get
+        for attribute, key in self._JSON_OPTIONAL_FIELDS:
+            setattr(self, attribute, get(key))
+
     @classmethod
     @abstractmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
@@ -433,49 +576,85 @@ class _BaseModel(ABC):
         ]
 
 
-_T = TypeVar("_T")
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
+class _BaseListedModel(_BaseModel, ABC):
+    """Model kept in lists merged with `update_list_with_models`"""
 
+    @property
+    @abstractmethod
+    def list_key(self) -> Hashable:
+        """Key used to match list items with incoming JSON data"""
+        raise NotImplementedError
 
-@attr.s(slots=True)
-class _BaseIdentifiableModel(_BaseModel, ABC):
-    id: str = attr.ib()
-    type: str = attr.ib()
+    @staticmethod
+    @abstractmethod
+    def get_json_list_key(json_data: Mapping[str, Any]) -> Hashable:
+        """Key used to match incoming JSON data with list items"""
+        raise NotImplementedError
+
+    @classmethod
+    def _create_from_json_keyed(
+        cls,
+        json_data: Mapping[str, Any],
+        api_object: PikComfortAPI,
+        list_key: Hashable,
+    ):
+        """Create model from JSON data with an already computed list key"""
+        return cls.create_from_json(json_data, api_object)
+
+    def _update_from_json_keyed(
+        self, json_data: Mapping[str, Any], list_key: Hashable
+    ) -> None:
+        """Update model from JSON data with an already computed list key"""
+        self.update_from_json(json_data)
 
     @classmethod
     def update_list_with_models(
-        cls: Type[_T],
-        target_list: List[_T],
-        json_data_list: List[Mapping[str, Any]],
+        cls: Type[_TModel],
+        target_list: List[_TModel],
+        json_data_list: Iterable[Mapping[str, Any]],
         api_object: PikComfortAPI,
     ) -> None:
-        cleanup: Set[Tuple[str, str]] = set()
+        remaining = {item.list_key: item for item in target_list}
+        new_items = []
+
         for item_data in json_data_list:
-            object_id, object_type = item_data["_uid"], item_data["_type"]
-            cleanup.add((object_id, object_type))
-            current_object = None
-
-            for existing_object in target_list:
-                if (
-                    existing_object.type == object_type
-                    and existing_object.id == object_id
-                ):
-                    current_object = existing_object
-                    break
+            item_key = cls.get_json_list_key(item_data)
+            current_object = remaining.pop(item_key, None)
 
             if current_object is None:
-                target_list.append(cls.create_from_json(item_data, api_object))
-
+                new_items.append(
+                    cls._create_from_json_keyed(item_data, api_object, item_key)
+                )
             else:
-                current_object.update_from_json(item_data)
+                current_object._update_from_json_keyed(item_data, item_key)
 
-        for current_object in tuple(reversed(target_list)):
-            if (current_object.id, current_object.type) not in cleanup:
-                target_list.remove(current_object)
-            else:
-                cleanup.remove((current_object.id, current_object.type))
+        # Keep order of retained items, drop stale ones and append new ones
+        if remaining:
+            target_list[:] = [
+                item for item in target_list if item.list_key not in remaining
+            ]
+        target_list.extend(new_items)
+
+
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
+class _BaseIdentifiableModel(_BaseListedModel, ABC):
+    id: str = attr.ib()
+    type: str = attr.ib()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}({self.id})>"
+
+    @property
+    def list_key(self) -> Tuple[str, str]:
+        return self.id, self.type
+
+    @staticmethod
+    def get_json_list_key(json_data: Mapping[str, Any]) -> Tuple[str, str]:
+        return json_data["_uid"], json_data["_type"]
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class InfoResult(_BaseIdentifiableModel):
     phone: str = attr.ib()
     gender: str = attr.ib()
@@ -491,6 +670,31 @@ class InfoResult(_BaseIdentifiableModel):
     accounts: List["PikComfortAccount"] = attr.ib()
     completed_tutorials: List[str] = attr.ib()
     hot_categories: List["HotCategory"] = attr.ib()
+    _account_index: Dict[Tuple[str, str], "PikComfortAccount"] = attr.ib(
+        init=False, factory=dict
+    )
+    _meter_index: Dict[Tuple[str, str], "PikComfortMeter"] = attr.ib(
+        init=False, factory=dict
+    )
+    _ticket_index: Dict[Tuple[str, str], "PikComfortTicket"] = attr.ib(
+        init=False, factory=dict
+    )
+
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("id", "_uid"),
+        ("type", "_type"),
+        ("phone", "phone"),
+        ("gender", "gender"),
+        ("first_name", "first_name"),
+        ("middle_name", "middle_name"),
+        ("last_name", "last_name"),
+        ("snils", "snils"),
+        ("passport_type", "passport_type"),
+        ("passport_number", "passport_number"),
+        ("birth_date", "birth_date"),
+        ("email", "email"),
+        ("email_verified", "email_verified"),
+    )
 
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
@@ -500,19 +704,7 @@ class InfoResult(_BaseIdentifiableModel):
 
         return cls(
             api=api_object,
-            id=json_data["_uid"],
-            type=json_data["_type"],
-            phone=json_data["phone"],
-            gender=json_data["gender"],
-            first_name=json_data["first_name"],
-            middle_name=json_data["middle_name"],
-            last_name=json_data["last_name"],
-            snils=json_data["snils"],
-            passport_type=json_data["passport_type"],
-            passport_number=json_data["passport_number"],
-            birth_date=json_data["birth_date"],
-            email=json_data["email"],
-            email_verified=json_data["email_verified"],
+            **cls._get_json_kwargs(json_data),
             # These attributes will be filled afterwards
             accounts=accounts,
             completed_tutorials=[
@@ -528,22 +720,42 @@ class InfoResult(_BaseIdentifiableModel):
             self.accounts, json_data["accounts"], self.api
         )
 
-        self.id = json_data["_uid"]
-        self.type = json_data["_type"]
-        self.phone = json_data["phone"]
-        self.gender = json_data["gender"]
-        self.first_name = json_data["first_name"]
-        self.middle_name = json_data["middle_name"]
-        self.last_name = json_data["last_name"]
-        self.snils = json_data["snils"]
-        self.passport_type = json_data["passport_type"]
-        self.passport_number = json_data["passport_number"]
-        self.birth_date = json_data["birth_date"]
-        self.email = json_data["email"]
-        self.email_verified = json_data["email_verified"]
-
-
-@attr.s(slots=True)
+        self._bulk_apply(json_data)
+        self._rebuild_indices()
+
+    def __attrs_post_init__(self) -> None:
+        self._rebuild_indices()
+
+    def _rebuild_indices(self) -> None:
+        self._account_index = {
+            (account.type, account.id): account for account in self.accounts
+        }
+        self._meter_index = {
+            (meter.type, meter.id): meter
+            for account in self.accounts
+            for meter in account.meters
+        }
+        self._ticket_index = {
+            (ticket.type, ticket.id): ticket
+            for account in self.accounts
+            for ticket in account.tickets
+        }
+
+    def get_account(
+        self, account_type: str, account_id: str
+    ) -> Optional["PikComfortAccount"]:
+        return self._account_index.get((account_type, account_id))
+
+    def get_meter(self, meter_type: str, meter_id: str) -> Optional["PikComfortMeter"]:
+        return self._meter_index.get((meter_type, meter_id))
+
+    def get_ticket(
+        self, ticket_type: str, ticket_id: str
+    ) -> Optional["PikComfortTicket"]:
+        return self._ticket_index.get((ticket_type, ticket_id))
+
+
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortAccount(_BaseIdentifiableModel):
     banned: bool = attr.ib()
     address: str = attr.ib()
@@ -586,6 +798,35 @@ class PikComfortAccount(_BaseIdentifiableModel):
     tickets: List["PikComfortTicket"] = attr.ib()
     insurance: Optional["Insurance"] = attr.ib(default=None)
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("banned", "banned"),
+        ("address", "address"),
+        ("premise_number", "premise_number"),
+        ("has_account_number", "has_account_number"),
+        ("import_id", "import_id"),
+        ("debt", "debt"),
+        ("userpayment_in_processing", "userpayment_in_processing"),
+        ("bill_type", "bill_type"),
+        ("brand_code", "brand_code"),
+        ("is_active", "is_active"),
+        ("is_moe", "is_moe"),
+        ("is_prepaid", "is_prepaid"),
+        ("new_receipt_day", "new_receipt_day"),
+        ("is_partial_pay_available", "is_partial_pay_available"),
+        ("pay_methods_available", "pay_methods_available"),
+        ("terminal_key", "terminal_key"),
+        ("available_services", "available_services"),
+        ("tickets_count", "tickets_count"),
+        ("tickets_are_viewed", "tickets_are_viewed"),
+        ("pik_rent_available", "pik_rent_available"),
+        # ("requisites", "requisites"),
+        ("final_payment_day", "final_payment_day"),
+        ("final_reading_day", "final_reading_day"),
+        ("chat_state", "chat_state"),
+        ("chat_schedule_description", "chat_schedule_description"),
+        ("emergency_phone_number", "emergency_phone_number"),
+    )
+
     @property
     def last_payment(self) -> Optional["PikComfortPayment"]:
         try:
@@ -623,16 +864,16 @@ class PikComfortAccount(_BaseIdentifiableModel):
         cls, json_data: Mapping[str, Any]
     ) -> Tuple[Optional[date], Optional[date], datetime]:
         last_readings_date = (
-            datetime.fromisoformat(json_data["last_readings_date"]).date()
+            _parse_iso_date(json_data["last_readings_date"])
             if json_data.get("last_readings_date")
             else None
         )
         last_turnover_date = (
-            datetime.fromisoformat(json_data["last_turnover_date"]).date()
+            _parse_iso_date(json_data["last_turnover_date"])
             if json_data.get("last_turnover_date")
             else None
         )
-        linked_at = datetime.fromisoformat(json_data["linked_at"])
+        linked_at = _parse_iso_datetime(json_data["linked_at"])
 
         return last_readings_date, last_turnover_date, linked_at
 
@@ -665,35 +906,10 @@ class PikComfortAccount(_BaseIdentifiableModel):
             api=api_object,
             id=json_data["_uid"],
             type=json_data["_type"],
-            banned=json_data["banned"],
-            address=json_data["address"],
-            premise_number=json_data["premise_number"],
-            has_account_number=json_data["has_account_number"],
-            import_id=json_data["import_id"],
+            **cls._get_json_kwargs(json_data),
             number=json_data.get("number") or None,
-            debt=json_data["debt"],
             last_readings_date=last_readings_date,
             last_turnover_date=last_turnover_date,
-            userpayment_in_processing=json_data["userpayment_in_processing"],
-            bill_type=json_data["bill_type"],
-            brand_code=json_data["brand_code"],
-            is_active=json_data["is_active"],
-            is_moe=json_data["is_moe"],
-            is_prepaid=json_data["is_prepaid"],
-            new_receipt_day=json_data["new_receipt_day"],
-            is_partial_pay_available=json_data["is_partial_pay_available"],
-            pay_methods_available=json_data["pay_methods_available"],
-            terminal_key=json_data["terminal_key"],
-            available_services=json_data["available_services"],
-            tickets_count=json_data["tickets_count"],
-            tickets_are_viewed=json_data["tickets_are_viewed"],
-            pik_rent_available=json_data["pik_rent_available"],
-            # requisites=account_data["requisites"],
-            final_payment_day=json_data["final_payment_day"],
-            final_reading_day=json_data["final_reading_day"],
-            chat_state=json_data["chat_state"],
-            chat_schedule_description=json_data["chat_schedule_description"],
-            emergency_phone_number=json_data["emergency_phone_number"],
             linked_at=linked_at,
             premise=premise,
             address_formats=address_formats,
@@ -707,9 +923,6 @@ class PikComfortAccount(_BaseIdentifiableModel):
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.id == json_data["_uid"], "UID does not match"
-        assert self.type == json_data["_type"], "type does not match"
-
         self.address_formats.update_from_json(json_data["address_formats"])
         self.building.update_from_json(json_data["building"])
         self.premise.update_from_json(json_data["premise"])
@@ -720,40 +933,21 @@ class PikComfortAccount(_BaseIdentifiableModel):
         PikComfortReceipt.update_list_with_models(
             self.receipts, json_data["receipts"], self.api
         )
+        PikComfortMeter.update_list_with_models(
+            self.meters, json_data["meters"], self.api
+        )
+        PikComfortPayment.update_list_with_models(
+            self.payments, json_data["payments"], self.api
+        )
 
         last_readings_date, last_turnover_date, linked_at = self._prepare_dates(
             json_data
         )
 
-        self.banned = json_data["banned"]
-        self.address = json_data["address"]
-        self.premise_number = json_data["premise_number"]
-        self.has_account_number = json_data["has_account_number"]
-        self.import_id = json_data["import_id"]
-        self.number = json_data["number"]
-        self.debt = json_data["debt"]
+        self._bulk_apply(json_data)
+        self.number = json_data.get("number") or None
         self.last_readings_date = last_readings_date
         self.last_turnover_date = last_turnover_date
-        self.userpayment_in_processing = json_data["userpayment_in_processing"]
-        self.bill_type = json_data["bill_type"]
-        self.brand_code = json_data["brand_code"]
-        self.is_active = json_data["is_active"]
-        self.is_moe = json_data["is_moe"]
-        self.is_prepaid = json_data["is_prepaid"]
-        self.new_receipt_day = json_data["new_receipt_day"]
-        self.is_partial_pay_available = json_data["is_partial_pay_available"]
-        self.pay_methods_available = json_data["pay_methods_available"]
-        self.terminal_key = json_data["terminal_key"]
-        self.available_services = json_data["available_services"]
-        self.tickets_count = json_data["tickets_count"]
-        self.tickets_are_viewed = json_data["tickets_are_viewed"]
-        self.pik_rent_available = json_data["pik_rent_available"]
-        # requisites=account_data["requisites"]
-        self.final_payment_day = json_data["final_payment_day"]
-        self.final_reading_day = json_data["final_reading_day"]
-        self.chat_state = json_data["chat_state"]
-        self.chat_schedule_description = json_data["chat_schedule_description"]
-        self.emergency_phone_number = json_data["emergency_phone_number"]
         self.linked_at = linked_at
 
     async def async_create_ticket(
@@ -773,7 +967,7 @@ class PikComfortAccount(_BaseIdentifiableModel):
         )
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortPremise(_BaseIdentifiableModel):
     number: str = attr.ib()
     address: str = attr.ib()
@@ -786,6 +980,20 @@ class PikComfortPremise(_BaseIdentifiableModel):
     user_premise_name: Optional[str] = attr.ib()
     address_formats: "PikComfortAddressFormat" = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("id", "_uid"),
+        ("type", "_type"),
+        ("number", "number"),
+        ("address", "address"),
+        ("building", "building"),
+        ("type_id", "type"),
+        ("common_space", "common_space"),
+        ("living_space", "living_space"),
+        ("nonliving_space", "nonliving_space"),
+        ("pay_space", "pay_space"),
+        ("user_premise_name", "user_premise_name"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
         address_formats = PikComfortAddressFormat.create_from_json(
@@ -794,37 +1002,17 @@ class PikComfortPremise(_BaseIdentifiableModel):
 
         return cls(
             api=api_object,
-            id=json_data["_uid"],
-            type=json_data["_type"],
-            number=json_data["number"],
-            address=json_data["address"],
-            building=json_data["building"],
-            type_id=json_data["type"],
-            common_space=json_data["common_space"],
-            living_space=json_data["living_space"],
-            nonliving_space=json_data["nonliving_space"],
-            pay_space=json_data["pay_space"],
-            user_premise_name=json_data["user_premise_name"],
+            **cls._get_json_kwargs(json_data),
             address_formats=address_formats,
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
         self.address_formats.update_from_json(json_data["address_formats"])
 
-        self.id = json_data["_uid"]
-        self.type = json_data["_type"]
-        self.number = json_data["number"]
-        self.address = json_data["address"]
-        self.building = json_data["building"]
-        self.type_id = json_data["type"]
-        self.common_space = json_data["common_space"]
-        self.living_space = json_data["living_space"]
-        self.nonliving_space = json_data["nonliving_space"]
-        self.pay_space = json_data["pay_space"]
-        self.user_premise_name = json_data["user_premise_name"]
+        self._bulk_apply(json_data)
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortBuilding(_BaseIdentifiableModel):
     address: str = attr.ib()
     type_id: int = attr.ib()
@@ -834,6 +1022,16 @@ class PikComfortBuilding(_BaseIdentifiableModel):
     living_space: Optional[float] = attr.ib()
     address_formats: "PikComfortAddressFormat" = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("id", "_uid"),
+        ("type", "_type"),
+        ("address", "address"),
+        ("type_id", "type"),
+        ("common_space", "common_space"),
+        ("nonliving_space", "nonliving_space"),
+        ("living_space", "living_space"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
         address_formats = PikComfortAddressFormat.create_from_json(
@@ -843,14 +1041,8 @@ class PikComfortBuilding(_BaseIdentifiableModel):
 
         return cls(
             api=api_object,
-            id=json_data["_uid"],
-            type=json_data["_type"],
-            address=json_data["address"],
-            type_id=json_data["type"],
+            **cls._get_json_kwargs(json_data),
             geo_location=geo_location,
-            common_space=json_data["common_space"],
-            nonliving_space=json_data["nonliving_space"],
-            living_space=json_data["living_space"],
             address_formats=address_formats,
         )
 
@@ -859,17 +1051,12 @@ class PikComfortBuilding(_BaseIdentifiableModel):
 
         geo_location = tuple(json_data["geo_location"])
 
-        self.id = json_data["_uid"]
-        self.type = json_data["_type"]
-        self.address = json_data["address"]
-        self.type_id = json_data["type"]
-        self.geo_location = geo_location
-        self.common_space = json_data["common_space"]
-        self.nonliving_space = json_data["nonliving_space"]
-        self.living_space = json_data["living_space"]
+        self._bulk_apply(json_data)
+        if geo_location != self.geo_location:
+            self.geo_location = geo_location
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortAddressFormat(_BaseModel):
     all: str = attr.ib()
     street_only: str = attr.ib()
@@ -877,23 +1064,20 @@ class PikComfortAddressFormat(_BaseModel):
     starting_with_street: str = attr.ib()
     finishing_with_street: str = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("all", "all"),
+        ("street_only", "street_only"),
+        ("finishing_with_village", "finishing_with_village"),
+        ("finishing_with_street", "finishing_with_street"),
+        ("starting_with_street", "starting_with_street"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
-        return cls(
-            api=api_object,
-            all=json_data["all"],
-            street_only=json_data["street_only"],
-            finishing_with_village=json_data["finishing_with_village"],
-            finishing_with_street=json_data["finishing_with_street"],
-            starting_with_street=json_data["starting_with_street"],
-        )
+        return cls(api=api_object, **cls._get_json_kwargs(json_data))
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        self.all = json_data["all"]
-        self.street_only = json_data["street_only"]
-        self.finishing_with_village = json_data["finishing_with_village"]
-        self.finishing_with_street = json_data["finishing_with_street"]
-        self.starting_with_street = json_data["starting_with_street"]
+        self._bulk_apply(json_data)
 
 
 class TicketStatus(IntEnum):
@@ -904,7 +1088,10 @@ class TicketStatus(IntEnum):
     DENIED = 203
 
 
-@attr.s(slots=True)
+_TICKET_STATUSES: Final = {status.value: status for status in TicketStatus}
+
+
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortTicket(_BaseIdentifiableModel):
     number: str = attr.ib()
     description: str = attr.ib()
@@ -919,17 +1106,26 @@ class PikComfortTicket(_BaseIdentifiableModel):
     comments: List["PikComfortComment"] = attr.ib()
     is_liked: Optional[bool] = attr.ib(default=None)
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("number", "number"),
+        ("description", "description"),
+        ("classifier_id", "classifier_id"),
+        ("status_id", "status"),
+        ("is_viewed", "is_viewed"),
+        ("is_commentable", "is_commentable"),
+    )
+
     @property
     def status(self) -> TicketStatus:
-        return TicketStatus(self.status_id)
+        return _TICKET_STATUSES.get(self.status_id, TicketStatus.UNKNOWN)
 
     @staticmethod
     def _prepare_dates(
         json_data: Mapping[str, Any]
     ) -> Tuple[datetime, datetime, datetime]:
-        last_status_changed = datetime.fromisoformat(json_data["last_status_changed"])
-        created = datetime.fromisoformat(json_data["created"])
-        updated = datetime.fromisoformat(json_data["updated"])
+        last_status_changed = _parse_iso_datetime(json_data["last_status_changed"])
+        created = _parse_iso_datetime(json_data["created"])
+        updated = _parse_iso_datetime(json_data["updated"])
 
         return last_status_changed, created, updated
 
@@ -947,23 +1143,15 @@ class PikComfortTicket(_BaseIdentifiableModel):
             api=api_object,
             id=json_data["_uid"],
             type=json_data["_type"],
-            number=json_data["number"],
-            description=json_data["description"],
-            classifier_id=json_data["classifier_id"],
-            status_id=json_data["status"],
-            is_viewed=json_data["is_viewed"],
+            **cls._get_json_kwargs(json_data),
             last_status_changed=last_status_changed,
             created=created,
             updated=updated,
-            is_commentable=json_data["is_commentable"],
             attachments=attachments,
             comments=comments,
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.id == json_data["_uid"], "UID does not match"
-        assert self.type == json_data["_type"], "type does not match"
-
         PikComfortComment.update_list_with_models(
             self.comments, json_data["comments"], self.api
         )
@@ -973,18 +1161,13 @@ class PikComfortTicket(_BaseIdentifiableModel):
 
         last_status_changed, created, updated = self._prepare_dates(json_data)
 
-        self.number = json_data["number"]
-        self.description = json_data["description"]
-        self.classifier_id = json_data["classifier_id"]
-        self.status_id = json_data["status"]
-        self.is_viewed = json_data["is_viewed"]
+        self._bulk_apply(json_data)
         self.last_status_changed = last_status_changed
         self.created = created
         self.updated = updated
-        self.is_commentable = json_data["is_commentable"]
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortComment(_BaseIdentifiableModel):
     ticket: str = attr.ib()
     text: str = attr.ib()
@@ -996,6 +1179,17 @@ class PikComfortComment(_BaseIdentifiableModel):
     notification_status: str = attr.ib()
     sender: str = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("ticket", "ticket"),
+        ("text", "text"),
+        ("source_created", "source_created"),
+        ("source_updated", "source_updated"),
+        ("is_system", "is_system"),
+        ("notification_channel", "notification_channel"),
+        ("notification_status", "notification_status"),
+        ("sender", "sender"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
         attachments = PikComfortAttachmentImage.create_from_json_list(
@@ -1006,32 +1200,20 @@ class PikComfortComment(_BaseIdentifiableModel):
             api=api_object,
             id=json_data["_uid"],
             type=json_data["_type"],
-            ticket=json_data["ticket"],
-            text=json_data["text"],
-            source_updated=json_data["source_updated"],
+            **cls._get_json_kwargs(json_data),
             attachments=attachments,
-            is_system=json_data["is_system"],
-            notification_channel=json_data["notification_channel"],
-            notification_status=json_data["notification_status"],
-            sender=json_data["sender"],
-            source_created=json_data["source_created"],
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.id == json_data["_uid"], "UID does not match"
-        assert self.type == json_data["_type"], "type does not match"
+        PikComfortAttachmentImage.update_list_with_models(
+            self.attachments, json_data["attachments"], self.api
+        )
 
-        self.ticket = json_data["ticket"]
-        self.text = json_data["text"]
-        self.source_updated = json_data["source_updated"]
-        self.is_system = json_data["is_system"]
-        self.notification_channel = json_data["notification_channel"]
-        self.notification_status = json_data["notification_status"]
-        self.sender = json_data["sender"]
+        self._bulk_apply(json_data)
 
 
-@attr.s(slots=True)
-class PikComfortAttachmentImage(_BaseModel):
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
+class PikComfortAttachmentImage(_BaseListedModel):
     id: str = attr.ib()
     created: datetime = attr.ib()
     name: str = attr.ib()
@@ -1041,70 +1223,48 @@ class PikComfortAttachmentImage(_BaseModel):
     linked_from: Optional[str] = attr.ib()
     file_link: str = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("name", "name"),
+        ("size", "size"),
+        ("content_type", "content_type"),
+        ("file_link", "file_link"),
+    )
+    _JSON_OPTIONAL_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("linked_from", "linked_from"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
-        created = datetime.fromisoformat(json_data["created"])
-        tags = tuple(json_data["tags"])
+        created = _parse_iso_datetime(json_data["created"])
+        tags = _shared_tuple(tuple(json_data["tags"]))
 
         return cls(
             api=api_object,
             id=json_data["uid"],
+            **cls._get_json_kwargs(json_data),
             created=created,
-            name=json_data["name"],
-            size=json_data["size"],
-            content_type=json_data["content_type"],
             tags=tags,
-            linked_from=json_data.get("linked_from"),
-            file_link=json_data["file_link"],
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.id == json_data["uid"], "UID does not match"
-
-        tags = tuple(json_data["tags"])
-        created = datetime.fromisoformat(json_data["created"])
+        tags = _shared_tuple(tuple(json_data["tags"]))
+        created = _parse_iso_datetime(json_data["created"])
 
+        self._bulk_apply(json_data)
         self.created = created
-        self.name = json_data["name"]
-        self.size = json_data["size"]
-        self.content_type = json_data["content_type"]
         self.tags = tags
-        self.linked_from = json_data.get("linked_from")
-        self.file_link = json_data["file_link"]
 
-    @classmethod
-    def update_list_with_models(
-        cls: Type[_T],
-        target_list: List[_T],
-        json_data_list: List[Mapping[str, Any]],
-        api_object: PikComfortAPI,
-    ) -> None:
-        cleanup: Set[str] = set()
-        for item_data in json_data_list:
-            attachment_id = item_data["uid"]
-            cleanup.add(attachment_id)
-            current_attachment = None
-
-            for existing_attachment in target_list:
-                if existing_attachment.id == attachment_id:
-                    current_attachment = existing_attachment
-                    break
-
-            if current_attachment is None:
-                target_list.append(cls.create_from_json(item_data, api_object))
-
-            else:
-                current_attachment.update_from_json(item_data)
+    @property
+    def list_key(self) -> str:
+        return self.id
 
-        for current_attachment in tuple(reversed(target_list)):
-            if current_attachment.id not in cleanup:
-                target_list.remove(current_attachment)
-            else:
-                cleanup.remove(current_attachment.id)
+    @staticmethod
+    def get_json_list_key(json_data: Mapping[str, Any]) -> str:
+        return json_data["uid"]
 
 
-@attr.s(slots=True)
-class PikComfortReceipt(_BaseModel):
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
+class PikComfortReceipt(_BaseListedModel):
     type: str = attr.ib()
     period: date = attr.ib()
     charge: float = attr.ib()
@@ -1119,89 +1279,70 @@ class PikComfortReceipt(_BaseModel):
     paid: Optional[float] = attr.ib(default=None)
     debt: Optional[float] = attr.ib(default=None)
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("charge", "charge"),
+        ("corrections", "charge_correct"),
+        ("payment", "payment"),
+        ("initial", "incoming_balance"),
+        ("subsidy", "subsidy"),
+        ("total", "total"),
+        ("penalty", "penalty"),
+    )
+    _JSON_OPTIONAL_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("paid", "paid"),
+        ("debt", "debt"),
+    )
+
     @classmethod
-    def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
+    def create_from_json(
+        cls,
+        json_data: Mapping[str, Any],
+        api_object: PikComfortAPI,
+        period: Optional[date] = None,
+    ):
         contents = PikComfortReceiptContent.create_from_json_list(
             json_data["main"], api_object
         )
 
-        period = datetime.fromisoformat(json_data["period"]).date()
+        if period is None:
+            period = _parse_iso_date(json_data["period"])
 
         return cls(
             api=api_object,
             type=json_data["_type"],
             period=period,
-            charge=json_data["charge"],
-            corrections=json_data["charge_correct"],
-            payment=json_data["payment"],
-            initial=json_data["incoming_balance"],
-            subsidy=json_data["subsidy"],
-            total=json_data["total"],
-            penalty=json_data["penalty"],
+            **cls._get_json_kwargs(json_data),
             contents=contents,
             # additional=json_data["additional"],
-            paid=json_data.get("paid"),
-            debt=json_data.get("debt"),
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.type == json_data["_type"], "type does not match"
-
-        period = datetime.fromisoformat(json_data["period"]).date()
-
-        assert self.period == period, "period does not match"
-
         PikComfortReceiptContent.update_list_with_models(
             self.contents, json_data["main"], self.api
         )
 
-        self.charge = json_data["charge"]
-        self.corrections = json_data["charge_correct"]
-        self.payment = json_data["payment"]
-        self.initial = json_data["incoming_balance"]
-        self.subsidy = json_data["subsidy"]
-        self.total = json_data["total"]
-        self.penalty = json_data["penalty"]
-        self.contents = json_data["main"]
+        self._bulk_apply(json_data)
         # self.additional = json_data["additional"]
-        self.paid = json_data.get("paid")
-        self.debt = json_data.get("debt")
+
+    @property
+    def list_key(self) -> Tuple[str, date]:
+        return self.type, self.period
+
+    @staticmethod
+    def get_json_list_key(json_data: Mapping[str, Any]) -> Tuple[str, date]:
+        return json_data["_type"], _parse_iso_date(json_data["period"])
 
     @classmethod
-    def update_list_with_models(
-        cls: Type[_T],
-        target_list: List[_T],
-        json_data_list: List[Mapping[str, Any]],
+    def _create_from_json_keyed(
+        cls,
+        json_data: Mapping[str, Any],
         api_object: PikComfortAPI,
-    ) -> None:
-        cleanup: Set[Tuple[str, date]] = set()
-        for item_data in json_data_list:
-            receipt_type = item_data["_type"]
-            receipt_period = datetime.fromisoformat(item_data["period"]).date()
-            cleanup.add((receipt_type, receipt_period))
-            current_receipt = None
-
-            for existing_receipt in target_list:
-                if (
-                    existing_receipt.type == receipt_type
-                    and existing_receipt.period == receipt_period
-                ):
-                    current_receipt = existing_receipt
-                    break
-
-            if current_receipt is None:
-                target_list.append(cls.create_from_json(item_data, api_object))
-            else:
-                current_receipt.update_from_json(item_data)
-
-        for current_receipt in tuple(reversed(target_list)):
-            if (current_receipt.type, current_receipt.period) not in cleanup:
-                target_list.remove(current_receipt)
-            else:
-                cleanup.remove((current_receipt.type, current_receipt.period))
+        list_key: Tuple[str, date],
+    ):
+        return cls.create_from_json(json_data, api_object, list_key[1])
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortReceiptContent(_BaseIdentifiableModel):
     import_id: str = attr.ib()
     title: str = attr.ib()
@@ -1218,6 +1359,22 @@ class PikComfortReceiptContent(_BaseIdentifiableModel):
     total: float = attr.ib()
     turnover_balance_records: List["TurnoverBalanceRecord"] = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("import_id", "import_id"),
+        ("title", "title"),
+        ("display_name", "display_name"),
+        ("address", "address"),
+        ("request_phone", "request_phone"),
+        ("dispatcher_phone", "dispatcher_phone"),
+        ("charge", "charge"),
+        ("corrections", "charge_correct"),
+        ("payment", "payment"),
+        ("initial", "incoming_balance"),
+        ("subsidy", "subsidy"),
+        ("penalty", "penalty"),
+        ("total", "total"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
         turnover_balance_records = TurnoverBalanceRecord.create_from_json_list(
@@ -1228,48 +1385,21 @@ class PikComfortReceiptContent(_BaseIdentifiableModel):
             api=api_object,
             id=json_data["_uid"],
             type=json_data["_type"],
-            import_id=json_data["import_id"],
-            title=json_data["title"],
-            display_name=json_data["display_name"],
-            address=json_data["address"],
-            request_phone=json_data["request_phone"],
-            dispatcher_phone=json_data["dispatcher_phone"],
-            charge=json_data["charge"],
-            corrections=json_data["charge_correct"],
-            payment=json_data["payment"],
-            initial=json_data["incoming_balance"],
-            subsidy=json_data["subsidy"],
-            penalty=json_data["penalty"],
-            total=json_data["total"],
+            **cls._get_json_kwargs(json_data),
             turnover_balance_records=turnover_balance_records,
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.id == json_data["_uid"], "UID does not match"
-        assert self.type == json_data["_type"], "type does not match"
-
         TurnoverBalanceRecord.update_list_with_models(
             self.turnover_balance_records,
             json_data["turnover_balance_records"],
             self.api,
         )
 
-        self.import_id = json_data["import_id"]
-        self.title = json_data["title"]
-        self.display_name = json_data["display_name"]
-        self.address = json_data["address"]
-        self.request_phone = json_data["request_phone"]
-        self.dispatcher_phone = json_data["dispatcher_phone"]
-        self.charge = json_data["charge"]
-        self.corrections = json_data["charge_correct"]
-        self.payment = json_data["payment"]
-        self.initial = json_data["incoming_balance"]
-        self.subsidy = json_data["subsidy"]
-        self.penalty = json_data["penalty"]
-        self.total = json_data["total"]
-
-
-@attr.s(slots=True)
+        self._bulk_apply(json_data)
+
+
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class TurnoverBalanceRecord(_BaseIdentifiableModel):
     service_name: str = attr.ib()
     service_code: str = attr.ib()
@@ -1281,36 +1411,29 @@ class TurnoverBalanceRecord(_BaseIdentifiableModel):
     payment: float = attr.ib()
     total: float = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("service_name", "service_name"),
+        ("service_code", "service_code"),
+        ("initial", "incoming_balance"),
+        ("charge", "charge"),
+        ("boosted_charge", "boosted_charge"),
+        ("corrections", "charge_correct"),
+        ("subsidy", "subsidy"),
+        ("payment", "payment"),
+        ("total", "total"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
         return cls(
             api=api_object,
             id=json_data["_uid"],
             type=json_data["_type"],
-            service_name=json_data["service_name"],
-            service_code=json_data["service_code"],
-            initial=json_data["incoming_balance"],
-            charge=json_data["charge"],
-            boosted_charge=json_data["boosted_charge"],
-            corrections=json_data["charge_correct"],
-            subsidy=json_data["subsidy"],
-            payment=json_data["payment"],
-            total=json_data["total"],
+            **cls._get_json_kwargs(json_data),
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.id == json_data["_uid"], "UID does not match"
-        assert self.type == json_data["_type"], "type does not match"
-
-        self.service_name = json_data["service_name"]
-        self.service_code = json_data["service_code"]
-        self.initial = json_data["incoming_balance"]
-        self.charge = json_data["charge"]
-        self.boosted_charge = json_data["boosted_charge"]
-        self.corrections = json_data["charge_correct"]
-        self.subsidy = json_data["subsidy"]
-        self.payment = json_data["payment"]
-        self.total = json_data["total"]
+        self._bulk_apply(json_data)
 
 
 class MeterResourceType(IntEnum):
@@ -1329,7 +1452,12 @@ class MeterResourceType(IntEnum):
         return cls.UNKNOWN
 
 
-@attr.s(slots=True)
+_METER_RESOURCE_TYPES: Final = {
+    resource_type.value: resource_type for resource_type in MeterResourceType
+}
+
+
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortMeter(_BaseIdentifiableModel):
     factory_number: str = attr.ib()
     resource_type_id: int = attr.ib()
@@ -1345,62 +1473,60 @@ class PikComfortMeter(_BaseIdentifiableModel):
     user_meter_name: Optional[str] = attr.ib(default=None)
     date_next_recalibration: Optional[date] = attr.ib(default=None)
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("factory_number", "factory_number"),
+        ("resource_type_id", "resource_type"),
+        ("has_user_readings", "has_user_readings"),
+        ("is_auto", "is_auto"),
+        ("import_id", "import_id"),
+        ("meter_type", "meter_type"),
+        ("is_individual", "is_individual"),
+        ("unit_name", "unit_name"),
+        ("recalibration_status", "recalibration_status"),
+        ("last_period", "last_period"),
+    )
+    _JSON_OPTIONAL_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("user_meter_name", "user_meter_name"),
+    )
+
     @property
     def resource_type(self) -> MeterResourceType:
-        return MeterResourceType(self.resource_type_id)
+        return _METER_RESOURCE_TYPES.get(
+            self.resource_type_id, MeterResourceType.UNKNOWN
+        )
 
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
         tariffs = Tariff.create_from_json_list(json_data["tariffs"], api_object)
+        # Tariffs are kept ordered by type for consumers
+        tariffs.sort(key=attrgetter("type"))
 
-        date_next_recalibration = (
-            datetime.fromisoformat(json_data["date_next_recalibration"]).date()
-            if json_data.get("date_next_recalibration")
-            else None
-        )
+        date_next_recalibration = json_data.get("date_next_recalibration")
+        if date_next_recalibration:
+            date_next_recalibration = _parse_iso_date(date_next_recalibration)
+        else:
+            date_next_recalibration = None
 
         return cls(
             api=api_object,
             id=json_data["_uid"],
             type=json_data["_type"],
-            factory_number=json_data["factory_number"],
-            resource_type_id=json_data["resource_type"],
-            has_user_readings=json_data["has_user_readings"],
-            is_auto=json_data["is_auto"],
-            import_id=json_data["import_id"],
-            meter_type=json_data["meter_type"],
-            is_individual=json_data["is_individual"],
-            unit_name=json_data["unit_name"],
-            recalibration_status=json_data["recalibration_status"],
-            last_period=json_data["last_period"],
-            user_meter_name=json_data.get("user_meter_name"),
+            **cls._get_json_kwargs(json_data),
             tariffs=tariffs,
             date_next_recalibration=date_next_recalibration,
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.id == json_data["_uid"], "UID does not match"
-        assert self.type == json_data["_type"], "type does not match"
+        Tariff.update_list_with_models(self.tariffs, json_data["tariffs"], self.api)
+        self.tariffs.sort(key=attrgetter("type"))
 
-        Tariff.update_list_with_models(self.tariffs, json_data["tariffs"])
-
-        date_next_recalibration = (
-            datetime.fromisoformat(json_data["date_next_recalibration"]).date()
-            if json_data.get("date_next_recalibration")
-            else None
-        )
+        date_next_recalibration = json_data.get("date_next_recalibration")
+        if date_next_recalibration:
+            date_next_recalibration = _parse_iso_date(date_next_recalibration)
+        else:
+            date_next_recalibration = None
 
-        self.factory_number = json_data["factory_number"]
-        self.resource_type_id = json_data["resource_type"]
-        self.has_user_readings = json_data["has_user_readings"]
-        self.is_auto = json_data["is_auto"]
-        self.import_id = json_data["import_id"]
-        self.meter_type = json_data["meter_type"]
-        self.is_individual = json_data["is_individual"]
-        self.unit_name = json_data["unit_name"]
-        self.recalibration_status = json_data["recalibration_status"]
-        self.last_period = json_data["last_period"]
-        self.user_meter_name = json_data.get("user_meter_name")
+        self._bulk_apply(json_data)
         self.date_next_recalibration = date_next_recalibration
 
     async def async_submit_readings(
@@ -1421,12 +1547,10 @@ class PikComfortMeter(_BaseIdentifiableModel):
         else:
             iterator = enumerate(values, start=1)
 
+        tariffs_by_type = {tariff.type: tariff for tariff in self.tariffs}
+
         for tariff_id, value in iterator:
-            existing_tariff = None
-            for tariff in self.tariffs:
-                if tariff_id == tariff.type:
-                    existing_tariff = tariff
-                    break
+            existing_tariff = tariffs_by_type.get(tariff_id)
 
             if existing_tariff is None:
                 raise ValueError(f"tariff {tariff_id} does not exist")
@@ -1456,7 +1580,7 @@ class PikComfortMeter(_BaseIdentifiableModel):
                 )
                 raise PikComfortException("Could not submit readings")
 
-            resp_data = await request.json()
+            resp_data = await request.json(loads=_json_loads)
 
         if not isinstance(resp_data, list):
             _LOGGER.error(f"[{self}] Response data does not contain submission updates")
@@ -1465,8 +1589,8 @@ class PikComfortMeter(_BaseIdentifiableModel):
         return PikComfortMeterReading.create_from_json_list(resp_data, self.api)
 
 
-@attr.s(slots=True)
-class Tariff(_BaseModel):
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
+class Tariff(_BaseListedModel):
     type: int = attr.ib()
     value: float = attr.ib()
     average_in_month: float = attr.ib()
@@ -1474,19 +1598,25 @@ class Tariff(_BaseModel):
     user_value_updated: Optional[datetime] = attr.ib(default=None)
     user_value_created: Optional[datetime] = attr.ib(default=None)
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("value", "value"),
+        ("average_in_month", "average_in_month"),
+        ("user_value", "user_value"),
+    )
+
     @staticmethod
     def _prepare_dates(
         json_data: Mapping[str, Any]
     ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        get = json_data.get
+
+        user_value_created = get("user_value_created")
         user_value_created = (
-            datetime.fromisoformat(json_data["user_value_created"])
-            if json_data.get("user_value_created")
-            else None
+            _parse_iso_datetime(user_value_created) if user_value_created else None
         )
+        user_value_updated = get("user_value_updated")
         user_value_updated = (
-            datetime.fromisoformat(json_data["user_value_updated"])
-            if json_data.get("user_value_updated")
-            else None
+            _parse_iso_datetime(user_value_updated) if user_value_updated else None
         )
 
         return user_value_created, user_value_updated
@@ -1498,50 +1628,25 @@ class Tariff(_BaseModel):
         return cls(
             api=api_object,
             type=json_data["type"],
-            value=json_data["value"],
-            average_in_month=json_data["average_in_month"],
-            user_value=json_data["user_value"],
+            **cls._get_json_kwargs(json_data),
             user_value_created=user_value_created,
             user_value_updated=user_value_updated,
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.type == json_data["type"], "types do not match"
-
         user_value_created, user_value_updated = self._prepare_dates(json_data)
 
-        self.value = json_data["value"]
-        self.average_in_month = json_data["average_in_month"]
-        self.user_value = json_data["user_value"]
+        self._bulk_apply(json_data)
         self.user_value_created = user_value_created
         self.user_value_updated = user_value_updated
 
-    @classmethod
-    def update_list_with_models(
-        cls: Type[_T], target_list: List[_T], json_data_list: List[Mapping[str, Any]]
-    ) -> None:
-        cleanup: Set[int] = set()
-        for item_data in json_data_list:
-            tariff_type = item_data["type"]
-            cleanup.add(tariff_type)
-            current_tariff = None
-
-            for existing_object in target_list:
-                if tariff_type.type == tariff_type:
-                    current_tariff = existing_object
-                    break
-
-            if current_tariff is None:
-                target_list.append(cls.create_from_json(item_data))
-
-            else:
-                current_tariff.update_from_json(item_data)
+    @property
+    def list_key(self) -> int:
+        return self.type
 
-        for current_tariff in tuple(reversed(target_list)):
-            if current_tariff.type not in cleanup:
-                target_list.remove(current_tariff)
-            else:
-                cleanup.remove(current_tariff.type)
+    @staticmethod
+    def get_json_list_key(json_data: Mapping[str, Any]) -> int:
+        return json_data["type"]
 
 
 class PaymentStatus(IntEnum):
@@ -1555,7 +1660,10 @@ class PaymentStatus(IntEnum):
         return cls.UNKNOWN
 
 
-@attr.s(slots=True)
+_PAYMENT_STATUSES: Final = {status.value: status for status in PaymentStatus}
+
+
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortPayment(_BaseIdentifiableModel):
     amount: float = attr.ib()
     status_id: int = attr.ib()
@@ -1566,71 +1674,66 @@ class PikComfortPayment(_BaseIdentifiableModel):
     source_name: str = attr.ib()
     source_details: "PaymentPointDetails" = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("amount", "amount"),
+        ("status_id", "status"),
+        ("check_url", "check_url"),
+        ("bank_id", "bank_id"),
+        ("payment_type", "payment_type"),
+        ("source_name", "payment_point"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
         payment_point_details = PaymentPointDetails.create_from_json(
             json_data["payment_point_details"], api_object
         )
 
-        timestamp = datetime.fromisoformat(json_data["payment_date"])
+        timestamp = _parse_iso_datetime(json_data["payment_date"])
 
         return cls(
             api=api_object,
             id=json_data["_uid"],
             type=json_data["_type"],
-            amount=json_data["amount"],
-            status_id=json_data["status"],
-            check_url=json_data["check_url"],
-            bank_id=json_data["bank_id"],
+            **cls._get_json_kwargs(json_data),
             timestamp=timestamp,
-            payment_type=json_data["payment_type"],
-            source_name=json_data["payment_point"],
             source_details=payment_point_details,
         )
 
     @property
     def status(self) -> PaymentStatus:
-        return PaymentStatus(self.status_id)
+        return _PAYMENT_STATUSES.get(self.status_id, PaymentStatus.UNKNOWN)
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.id == json_data["_uid"], "UID does not match"
-        assert self.type == json_data["_type"], "type does not match"
-
-        timestamp = datetime.fromisoformat(json_data["payment_date"])
+        timestamp = _parse_iso_datetime(json_data["payment_date"])
 
         self.source_details.update_from_json(json_data["payment_point_details"])
 
-        self.amount = json_data["amount"]
-        self.status_id = json_data["status"]
-        self.check_url = json_data["check_url"]
-        self.bank_id = json_data["bank_id"]
+        self._bulk_apply(json_data)
         self.timestamp = timestamp
-        self.payment_type = json_data["payment_type"]
-        self.source_name = json_data["payment_point"]
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PaymentPointDetails(_BaseModel):
     icon_name: str = attr.ib()
     normalized_name: str = attr.ib()
     color: str = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("icon_name", "icon_name"),
+        ("normalized_name", "normalized_name"),
+        ("color", "color"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
-        return cls(
-            api=api_object,
-            icon_name=json_data["icon_name"],
-            normalized_name=json_data["normalized_name"],
-            color=json_data["color"],
-        )
+        return cls(api=api_object, **cls._get_json_kwargs(json_data))
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        self.icon_name = json_data["icon_name"]
-        self.normalized_name = json_data["normalized_name"]
-        self.color = json_data["color"]
+        self._bulk_apply(json_data)
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class Insurance:
     # @TODO
     _id: str = attr.ib()
@@ -1641,7 +1744,7 @@ class Insurance:
     rate: float = attr.ib()
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class HotCategory:
     _id: str = attr.ib()
     _type: str = attr.ib()
@@ -1650,7 +1753,7 @@ class HotCategory:
     classifier_id: str = attr.ib()
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class AccountNotification:
     _id: str = attr.ib()
     _type: str = attr.ib()
@@ -1670,7 +1773,7 @@ class AccountNotification:
     image_x1: Optional["PikComfortAttachmentImage"] = attr.ib(default=None)
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class Action:
     _id: str = attr.ib()
     _type: str = attr.ib()
@@ -1682,21 +1785,26 @@ class Action:
     data: Optional["Datum"] = attr.ib(default=None)
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class Datum:
     reason: str = attr.ib()
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortMeterReading(_BaseIdentifiableModel):
     value: float = attr.ib()
     tariff_type: int = attr.ib()
     date: date = attr.ib()
     meter: "PikComfortMeterReadingMeterInfo" = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("value", "value"),
+        ("tariff_type", "tariff_type"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
-        date_ = datetime.fromisoformat(json_data["date"]).date()
+        date_ = _parse_iso_date(json_data["date"])
         meter = PikComfortMeterReadingMeterInfo.create_from_json(
             json_data["meter"], api_object
         )
@@ -1705,26 +1813,21 @@ class PikComfortMeterReading(_BaseIdentifiableModel):
             api=api_object,
             id=json_data["_uid"],
             type=json_data["_type"],
-            value=json_data["value"],
-            tariff_type=json_data["tariff_type"],
+            **cls._get_json_kwargs(json_data),
             date=date_,
             meter=meter,
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.id == json_data["_uid"], "UID does not match"
-        assert self.type == json_data["_type"], "type does not match"
-
-        date_ = datetime.fromisoformat(json_data["date"]).date()
+        date_ = _parse_iso_date(json_data["date"])
 
         self.meter.update_from_json(json_data["meter"])
 
-        self.value = json_data["value"]
-        self.tariff_type = json_data["tariff_type"]
+        self._bulk_apply(json_data)
         self.date = date_
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class PikComfortMeterReadingMeterInfo(_BaseIdentifiableModel):
     import_id: str = attr.ib()
     resource_type_id: int = attr.ib()
@@ -1732,28 +1835,25 @@ class PikComfortMeterReadingMeterInfo(_BaseIdentifiableModel):
     factory_number: str = attr.ib()
     meter_type: int = attr.ib()
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("import_id", "import_id"),
+        ("resource_type_id", "resource_type"),
+        ("is_auto", "is_auto"),
+        ("factory_number", "factory_number"),
+        ("meter_type", "meter_type"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
         return cls(
             api=api_object,
             id=json_data["_uid"],
             type=json_data["_type"],
-            import_id=json_data["import_id"],
-            resource_type_id=json_data["resource_type"],
-            is_auto=json_data["is_auto"],
-            factory_number=json_data["factory_number"],
-            meter_type=json_data["meter_type"],
+            **cls._get_json_kwargs(json_data),
         )
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
-        assert self.id == json_data["_uid"], "UID does not match"
-        assert self.type == json_data["_type"], "type does not match"
-
-        self.import_id = json_data["import_id"]
-        self.resource_type_id = json_data["resource_type"]
-        self.is_auto = json_data["is_auto"]
-        self.factory_number = json_data["factory_number"]
-        self.meter_type = json_data["meter_type"]
+        self._bulk_apply(json_data)
 
     @property
     def meter(self) -> Optional[PikComfortMeter]:
@@ -1761,21 +1861,16 @@ class PikComfortMeterReadingMeterInfo(_BaseIdentifiableModel):
         if info is None:
             return None
 
-        meter_id, meter_type = self.id, self.type
-
-        for account in info.accounts:
-            for meter in account.meters:
-                if meter.id == meter_id and meter.type == meter_type:
-                    return meter
-
-        return None
+        return info.get_meter(self.type, self.id)
 
     @property
     def resource_type(self) -> MeterResourceType:
-        return MeterResourceType(self.resource_type_id)
+        return _METER_RESOURCE_TYPES.get(
+            self.resource_type_id, MeterResourceType.UNKNOWN
+        )
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, eq=False, repr=False, weakref_slot=False)
 class TicketClassifier(_BaseIdentifiableModel):
     name: str = attr.ib()
     level: int = attr.ib()
@@ -1784,10 +1879,15 @@ class TicketClassifier(_BaseIdentifiableModel):
     parent_id: Optional[str] = attr.ib(default=None)
     hint: Optional[str] = attr.ib(default=None)
 
+    _JSON_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("name", "name"),
+        ("level", "level"),
+    )
+
     @classmethod
     def create_from_json(cls, json_data: Mapping[str, Any], api_object: PikComfortAPI):
-        created_at = datetime.fromisoformat(json_data["created"])
-        updated_at = datetime.fromisoformat(json_data["updated"])
+        created_at = _parse_iso_datetime(json_data["created"])
+        updated_at = _parse_iso_datetime(json_data["updated"])
         id_ = json_data["_uid"]
         parent_id = json_data.get("parent")
         if parent_id == id_:
@@ -1797,8 +1897,7 @@ class TicketClassifier(_BaseIdentifiableModel):
             api=api_object,
             id=id_,
             type=json_data["_type"],
-            name=json_data["name"],
-            level=json_data["level"],
+            **cls._get_json_kwargs(json_data),
             created_at=created_at,
             updated_at=updated_at,
             parent_id=parent_id,
@@ -1807,18 +1906,15 @@ class TicketClassifier(_BaseIdentifiableModel):
 
     def update_from_json(self, json_data: Mapping[str, Any]) -> None:
         id_ = json_data["_uid"]
-        assert self.id == id_, "UID does not match"
-        assert self.type == json_data["_type"], "type does not match"
 
-        created_at = datetime.fromisoformat(json_data["created"])
-        updated_at = datetime.fromisoformat(json_data["updated"])
+        created_at = _parse_iso_datetime(json_data["created"])
+        updated_at = _parse_iso_datetime(json_data["updated"])
 
         parent_id = json_data.get("parent")
         if parent_id == id_:
             parent_id = None
 
-        self.name = json_data["name"]
-        self.level = json_data["level"]
+        self._bulk_apply(json_data)
         self.created_at = created_at
         self.updated_at = updated_at
         self.parent_id = parent_id
@@ -1830,37 +1926,27 @@ class TicketClassifier(_BaseIdentifiableModel):
         if not parent_id:
             return None
 
-        classifiers = self.api.classifiers
-        if classifiers is None:
+        api = self.api
+        if api.classifiers is None:
             raise PikComfortException("Classifiers must be updated")
 
-        for classifier in classifiers:
-            if classifier.id == parent_id:
-                return classifier
-
-        return None
+        return api.get_classifier(parent_id)
 
     @property
     def has_children(self) -> bool:
-        classifiers = self.api.classifiers
-        if classifiers is None:
+        api = self.api
+        if api.classifiers is None:
             raise PikComfortException("Classifiers must be updated")
 
-        for classifier in classifiers:
-            if classifier.parent_id == self.id:
-                return True
-
-        return False
+        return bool(api.get_child_classifiers(self.id))
 
     @property
     def children(self) -> Tuple["TicketClassifier", ...]:
-        classifiers = self.api.classifiers
-        if classifiers is None:
+        api = self.api
+        if api.classifiers is None:
             raise PikComfortException("Classifiers must be updated")
 
-        return tuple(
-            classifier for classifier in classifiers if classifier.parent_id == self.id
-        )
+        return api.get_child_classifiers(self.id)
 
     @property
     def path_to(self) -> Tuple["TicketClassifier", ...]:
@@ -1869,9 +1955,10 @@ class TicketClassifier(_BaseIdentifiableModel):
     @property
     def path_from(self) -> Tuple["TicketClassifier", ...]:
         path = []
+        seen_ids = set()
         path_item = self
         while path_item is not None:
-            if path_item in path:
+            if path_item.id in seen_ids:
                 _LOGGER.error(
                     f"Detected loop while building classifier path: "
                     f"for={self.id}, "
@@ -1880,6 +1967,7 @@ class TicketClassifier(_BaseIdentifiableModel):
                 )
                 raise PikComfortException("Path loop detected")
 
+            seen_ids.add(path_item.id)
             path.append(path_item)
             path_item = path_item.parent
 
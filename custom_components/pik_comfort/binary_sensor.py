@@ -1,13 +1,14 @@
 import asyncio
 import logging
-from typing import Any, Dict, Final, Mapping, Optional, Union
+import re
+from typing import Any, Dict, Final, List, Mapping, Optional, Union
 
 import voluptuous as vol
 from homeassistant.components import persistent_notification
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_ENTITY_ID
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.typing import HomeAssistantType
 
 from custom_components.pik_comfort._base import (
@@ -34,35 +35,44 @@ from custom_components.pik_comfort.const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+ZONE_ID_PATTERN: Final = re.compile(r"^t\d+$")
+
+
+def _indications_sequence_to_mapping(values: List[float]) -> Dict[str, float]:
+    return {f"t{zone}": value for zone, value in enumerate(values, start=1)}
+
+
 INDICATIONS_MAPPING_SCHEMA = vol.Schema(
     {
-        vol.Required(vol.Match(r"t\d+")): cv.positive_float,
+        vol.Required(vol.Match(ZONE_ID_PATTERN)): cv.positive_float,
     }
 )
 
 INDICATIONS_SEQUENCE_SCHEMA = vol.All(
     vol.Any(vol.All(cv.positive_float, cv.ensure_list), [cv.positive_float]),
-    lambda x: dict(map(lambda y: ("t" + str(y[0]), y[1]), enumerate(x, start=1))),
+    _indications_sequence_to_mapping,
 )
 
 SERVICE_PUSH_READINGS: Final = "push_readings"
-SERVICE_PUSH_READINGS_SCHEMA = {
-    vol.Required(ATTR_READINGS): vol.Any(
-        vol.All(
-            cv.string,
-            lambda x: list(map(str.strip, x.split(","))),
+SERVICE_PUSH_READINGS_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_READINGS): vol.Any(
+            vol.All(
+                cv.string,
+                lambda x: list(map(str.strip, x.split(","))),
+                INDICATIONS_SEQUENCE_SCHEMA,
+            ),
+            INDICATIONS_MAPPING_SCHEMA,
             INDICATIONS_SEQUENCE_SCHEMA,
         ),
-        INDICATIONS_MAPPING_SCHEMA,
-        INDICATIONS_SEQUENCE_SCHEMA,
-    ),
-    vol.Optional(ATTR_IGNORE_READINGS, default=False): cv.boolean,
-    vol.Optional(ATTR_INCREMENTAL, default=False): cv.boolean,
-    vol.Optional(ATTR_NOTIFICATION, default=False): vol.Any(
-        cv.boolean,
-        persistent_notification.SCHEMA_SERVICE_CREATE,
-    ),
-}
+        vol.Optional(ATTR_IGNORE_READINGS, default=False): cv.boolean,
+        vol.Optional(ATTR_INCREMENTAL, default=False): cv.boolean,
+        vol.Optional(ATTR_NOTIFICATION, default=False): vol.Any(
+            cv.boolean,
+            persistent_notification.SCHEMA_SERVICE_CREATE,
+        ),
+    }
+)
 
 
 async def async_process_update(
@@ -72,10 +82,12 @@ async def async_process_update(
     entities = hass.data[DATA_ENTITIES][config_entry_id]
 
     new_entities = []
-    remove_tasks = []
+    remove_coroutines = []
 
-    meter_entities = entities.get(PikComfortMeterSensor, [])
-    old_meter_entities = list(meter_entities)
+    remaining_meter_entities = {
+        (entity.meter_type, entity.meter_id): entity
+        for entity in entities.get(PikComfortMeterSensor, [])
+    }
 
     # Process accounts
     for account in api_object.info.accounts:
@@ -84,30 +96,26 @@ async def async_process_update(
         # Process meters per account
         for meter in account.meters:
             meter_key = (meter.type, meter.id)
-            existing_entity = None
-
-            for entity in meter_entities:
-                if (entity.meter_type, entity.meter_id) == meter_key:
-                    existing_entity = entity
-                    old_meter_entities.remove(existing_entity)
-                    break
+            existing_entity = remaining_meter_entities.pop(meter_key, None)
 
             if existing_entity is None:
                 new_entities.append(
                     PikComfortMeterSensor(config_entry_id, *account_key, *meter_key)
                 )
             else:
-                existing_entity.async_schedule_update_ha_state(force_refresh=False)
+                existing_entity.async_write_ha_state()
 
-    for entity in old_meter_entities:
-        _LOGGER.debug(f"Scheduling entity {entity} for removal")
-        remove_tasks.append(hass.async_create_task(entity.async_remove()))
+    for entity in remaining_meter_entities.values():
+        _LOGGER.debug("Scheduling entity %s for removal", entity)
+        remove_coroutines.append(entity.async_remove())
 
     if new_entities:
         async_add_entities(new_entities, False)
 
-    if remove_tasks:
-        await asyncio.wait(remove_tasks, return_when=asyncio.ALL_COMPLETED)
+    if remove_coroutines:
+        for result in await asyncio.gather(*remove_coroutines, return_exceptions=True):
+            if isinstance(result, BaseException):
+                _LOGGER.error("Error removing entity: %s", result, exc_info=result)
 
 
 async def async_setup_entry(
@@ -118,6 +126,12 @@ async def async_setup_entry(
     async def _async_process_update() -> None:
         return await async_process_update(hass, config_entry_id, async_add_entities)
 
+    entity_platform.async_get_current_platform().async_register_entity_service(
+        SERVICE_PUSH_READINGS,
+        SERVICE_PUSH_READINGS_SCHEMA,
+        "async_service_push_readings",
+    )
+
     await async_setup_entry_for_platforms(hass, config_entry, _async_process_update)
 
     return True
@@ -137,6 +151,7 @@ class PikComfortMeterSensor(BasePikComfortEntity, BinarySensorEntity):
 
         self.meter_type: str = meter_type
         self.meter_id: str = meter_id
+        self._unique_id = f"meter__{meter_type}__{meter_id}"
 
     @property
     def meter_object(self) -> Optional[PikComfortMeter]:
@@ -145,13 +160,7 @@ class PikComfortMeterSensor(BasePikComfortEntity, BinarySensorEntity):
         if info is None:
             return None
 
-        key = (self.meter_type, self.meter_id)
-        for account in info.accounts:
-            for meter in account.meters:
-                if (meter.type, meter.id) == key:
-                    return meter
-
-        return None
+        return info.get_meter(self.meter_type, self.meter_id)
 
     @property
     def name(self) -> str:
@@ -160,10 +169,11 @@ class PikComfortMeterSensor(BasePikComfortEntity, BinarySensorEntity):
         if meter_object is None:
             return f"Meter {self.meter_id}"
 
-        if meter_object.meter_type == MeterResourceType.UNKNOWN:
+        resource_type = meter_object.resource_type
+        if resource_type == MeterResourceType.UNKNOWN:
             type_suffix = "Unknown Type"
         else:
-            type_suffix = meter_object.resource_type.name.replace("_", " ").title()
+            type_suffix = resource_type.name.replace("_", " ").title()
 
         meter_name = meter_object.user_meter_name
         if not meter_name:
@@ -175,11 +185,6 @@ class PikComfortMeterSensor(BasePikComfortEntity, BinarySensorEntity):
     def icon(self) -> str:
         return "mdi:counter"
 
-    @property
-    def unique_id(self) -> str:
-        meter_object = self.meter_object
-        return "meter__" + meter_object.type + "__" + meter_object.id
-
     # @property
     # def unit_of_measurement(self) -> str:
     #     return self._meter_object.unit_name
@@ -204,18 +209,18 @@ class PikComfortMeterSensor(BasePikComfortEntity, BinarySensorEntity):
             "resource_type": meter_object.resource_type.name.lower(),
         }
 
-        for tariff in sorted(meter_object.tariffs, key=lambda x: x.type):
-            for key, value in {
-                "value": tariff.value,
-                "monthly_average": tariff.average_in_month,
-                "submitted_value": tariff.user_value,
-                "submitted_at": (
-                    tariff.user_value_updated.isoformat()
-                    if tariff.user_value_updated
-                    else None
-                ),
-            }.items():
-                device_state_attributes[f"tariff_{tariff.type}_{key}"] = value
+        for tariff in meter_object.tariffs:
+            prefix = f"tariff_{tariff.type}_"
+            user_value_updated = tariff.user_value_updated
+
+            device_state_attributes[prefix + "value"] = tariff.value
+            device_state_attributes[
+                prefix + "monthly_average"
+            ] = tariff.average_in_month
+            device_state_attributes[prefix + "submitted_value"] = tariff.user_value
+            device_state_attributes[prefix + "submitted_at"] = (
+                user_value_updated.isoformat() if user_value_updated else None
+            )
 
         device_state_attributes.update(
             {
@@ -239,19 +244,14 @@ class PikComfortMeterSensor(BasePikComfortEntity, BinarySensorEntity):
         meter_object: PikComfortMeter, call_data: Mapping
     ) -> Dict[int, float]:
         indications: Mapping[str, Union[int, float]] = call_data[ATTR_READINGS]
-        meter_tariffs = meter_object.tariffs
+        tariffs_by_type = {tariff.type: tariff for tariff in meter_object.tariffs}
         is_incremental = call_data[ATTR_INCREMENTAL]
 
         submit_call_args = {}
 
         for zone_id, new_value in indications.items():
             tariff_type = int(zone_id[1:])
-            existing_tariff = None
-            for tariff in meter_tariffs:
-                if tariff.type == tariff_type:
-                    existing_tariff = tariff
-                    break
-
+            existing_tariff = tariffs_by_type.get(tariff_type)
             if existing_tariff is None:
                 raise ValueError(f"meter zone {zone_id} does not exist")
 
@@ -264,18 +264,6 @@ class PikComfortMeterSensor(BasePikComfortEntity, BinarySensorEntity):
 
         return submit_call_args
 
-    async def async_added_to_hass(self) -> None:
-        await super().async_added_to_hass()
-
-        meter_object = self.meter_object
-
-        if not meter_object.is_auto:
-            self.platform.async_register_entity_service(
-                SERVICE_PUSH_READINGS,
-                SERVICE_PUSH_READINGS_SCHEMA,
-                "async_service_push_readings",
-            )
-
     def _fire_callback_event(
         self,
         call_data: Mapping[str, Any],
@@ -288,13 +276,14 @@ class PikComfortMeterSensor(BasePikComfortEntity, BinarySensorEntity):
 
         comment = event_data.get(ATTR_COMMENT)
         message = "Response comment not provided" if comment is None else str(comment)
-        meter_number = "<unavailable>" if meter is None else meter.factory_number
+        factory_number = None if meter is None else meter.factory_number
+        meter_number = "<unavailable>" if meter is None else factory_number
 
         event_data = {
             ATTR_ENTITY_ID: self.entity_id,
             "meter_id": self.meter_id,
             "meter_type": self.meter_type,
-            "meter_number": None if meter is None else meter.factory_number,
+            "meter_number": factory_number,
             "call_params": dict(call_data),
             ATTR_SUCCESS: False,
             ATTR_COMMENT: None,
@@ -346,6 +335,9 @@ class PikComfortMeterSensor(BasePikComfortEntity, BinarySensorEntity):
             if meter_object is None:
                 raise Exception("Meter is unavailable")
 
+            if meter_object.is_auto:
+                raise Exception("Meter readings are submitted automatically")
+
             submit_call_args = self.get_submit_call_args(meter_object, call_data)
 
             event_data[ATTR_READINGS] = submit_call_args
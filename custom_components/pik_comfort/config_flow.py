@@ -1,14 +1,14 @@
 import logging
-import re
 from abc import ABC, abstractmethod
-from collections import ChainMap
+from copy import copy
 from datetime import datetime
 from time import time
-from typing import Any, ClassVar, Dict, Final, Optional, Tuple
+from typing import Any, ClassVar, Dict, Final, Optional, Set, Tuple
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_BASE, CONF_SCAN_INTERVAL, CONF_TOKEN
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowHandler
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.dt import as_local
@@ -36,6 +36,93 @@ CONF_REQUEST_NEW_OTP_CODE: Final = "request_new_otp_code"
 CONF_OTP_CODE: Final = "otp_code"
 
 
+class _DigitsOnlyTable(dict):
+    """Translation table keeping ASCII digits and deleting everything else"""
+
+    def __missing__(self, codepoint: int) -> None:
+        return None
+
+
+DIGITS_ONLY_TABLE: Final = _DigitsOnlyTable(
+    (c, c) for c in range(ord("0"), ord("9") + 1)
+)
+
+# Digits count -> length of the prefix that decides how to canonicalize
+PHONE_NUMBER_PREFIX_LENGTHS: Final = {10: 0, 11: 1, 13: 3}
+
+# (digits count, prefix) -> (replacement prefix, digits to strip)
+PHONE_NUMBER_RULES: Final = {
+    (10, ""): ("7", 0),
+    (11, "7"): ("", 0),
+    (11, "8"): ("7", 1),
+    (13, "007"): ("", 2),
+    (13, "008"): ("7", 3),
+}
+
+
+def _canonicalize_phone_number(digits: str) -> Optional[str]:
+    length = len(digits)
+    prefix_length = PHONE_NUMBER_PREFIX_LENGTHS.get(length)
+    if prefix_length is None:
+        return None
+
+    rule = PHONE_NUMBER_RULES.get((length, digits[:prefix_length]))
+    if rule is None:
+        return None
+
+    prefix, strip = rule
+    return prefix + digits[strip:]
+
+
+OTP_INPUT_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_OTP_CODE): cv.string,
+        vol.Optional(CONF_REQUEST_NEW_OTP_CODE, default=False): cv.boolean,
+    }
+)
+
+# Runtime values are filled in as suggested values when forms are shown
+USER_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_PHONE_NUMBER): cv.string,
+        vol.Optional(CONF_TOKEN): str,
+        vol.Required(CONF_DEVICE_NAME): vol.All(cv.string, vol.Length(min=3)),
+    }
+)
+
+OPTIONS_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_TOKEN): cv.string,
+        vol.Required(CONF_DEVICE_NAME): vol.All(cv.string, vol.Length(min=3)),
+        vol.Optional(CONF_SCAN_INTERVAL): cv.positive_time_period_dict,
+        vol.Optional(CONF_REQUEST_NEW_TOKEN, default=False): cv.boolean,
+    }
+)
+
+
+def _add_suggested_values_to_schema(
+    data_schema: vol.Schema, suggested_values: Dict[str, Any]
+) -> vol.Schema:
+    # FlowHandler.add_suggested_values_to_schema is missing on Home Assistant 2021.4
+    schema = {}
+    for key, value in data_schema.schema.items():
+        if isinstance(key, vol.Marker) and key in suggested_values:
+            # Copy the marker to keep the shared schema untouched
+            new_key = copy(key)
+            new_key.description = {"suggested_value": suggested_values[key]}
+            key = new_key
+        schema[key] = value
+    return vol.Schema(schema)
+
+
+# Exception class -> (intl error code, log message title)
+ERROR_HANDLING: Final = {
+    ServerError: ("server_error", "Ошибка сервера"),
+    RequestError: ("request_error", "Ошибка запроса"),
+    PikComfortException: ("api_error", "Ошибка API"),
+}
+
+
 def _format_phone_number(phone_number: str) -> str:
     return (
         f"+{phone_number[0]} ({phone_number[1:4]}) "
@@ -44,49 +131,81 @@ def _format_phone_number(phone_number: str) -> str:
     )
 
 
-def _handle_exception(
-    phone_number: str, error: BaseException
-) -> Optional[Tuple[str, str, Optional[str]]]:
-    """Handle exception
+def _classify_exception(error: BaseException) -> Tuple[str, str, Optional[str], str]:
+    """Classify exception without logging it
 
-    :param error:
-    :return: (Intl error code, error message, error code)
+    :param error: Raised exception
+    :return: (Intl error code, error message, error code, log message)
     """
-    log_prefix = f"[{mask_username(phone_number)}] "
+    for error_class in type(error).__mro__:
+        handling = ERROR_HANDLING.get(error_class)
+        if handling is not None:
+            break
+    else:
+        handling = ("unknown_error", "Неизвестная ошибка")
+
+    intl_error_code, log_title = handling
 
-    if isinstance(error, ServerError):
+    if intl_error_code == "server_error":
         error_code = error.error_code
         error_message = error.error_message
-        log_message = f"Ошибка сервера ({error_code}): {error_message}"
-        intl_error_code = "server_error"
+        log_message = f"{log_title} ({error_code}): {error_message}"
     else:
         error_code = None
         error_message = str(error)
-        if isinstance(error, RequestError):
-            log_message = f"Ошибка запроса: {error_message}"
-            intl_error_code = "request_error"
-        elif isinstance(error, PikComfortException):
-            log_message = f"Ошибка API: {error_message}"
-            intl_error_code = "api_error"
-        else:
-            log_message = f"Неизвестная ошибка: {error_message}"
-            intl_error_code = "unknown_error"
+        log_message = f"{log_title}: {error_message}"
 
-    _LOGGER.exception(log_prefix + log_message, exc_info=error)
-    return intl_error_code, error_message, error_code
+    return intl_error_code, error_message, error_code, log_message
 
 
 class _WithOTPInput(FlowHandler, ABC):
     def __init__(self) -> None:
-        self._device_name: str = get_random_device_name()
+        self._device_name: Optional[str] = None
         self._phone_number: Optional[str] = None
+        self._formatted_phone_number: Optional[str] = None
+        self._log_prefix: str = ""
         self._auth_token: Optional[str] = None
         self._otp_expires_at: Optional[float] = None
+        self._otp_expires_at_text: Optional[str] = None
+        self._api_object: Optional[PikComfortAPI] = None
+        self._logged_errors: Set[Tuple[str, Optional[str]]] = set()
+
+    def _set_phone_number(self, phone_number: str) -> None:
+        self._phone_number = phone_number
+        self._formatted_phone_number = _format_phone_number(phone_number)
+        self._log_prefix = f"[{mask_username(phone_number)}] "
+
+    def _handle_exception(self, error: BaseException) -> Tuple[str, str, Optional[str]]:
+        intl_error_code, error_message, error_code, log_message = _classify_exception(
+            error
+        )
+
+        # Full traceback only on the first occurrence of an error within the flow
+        error_key = (intl_error_code, error_code)
+        if error_key in self._logged_errors:
+            _LOGGER.warning("%s%s", self._log_prefix, log_message)
+        else:
+            self._logged_errors.add(error_key)
+            _LOGGER.exception("%s%s", self._log_prefix, log_message, exc_info=error)
+
+        return intl_error_code, error_message, error_code
 
     @abstractmethod
     def _create_entry(self) -> Dict[str, Any]:
         raise NotImplementedError
 
+    async def _async_close_api_object(self) -> None:
+        api_object, self._api_object = self._api_object, None
+        if api_object is not None:
+            await api_object.async_close()
+
+    @callback
+    def async_remove(self) -> None:
+        # Flow got aborted or finished while an API session is still open
+        api_object, self._api_object = self._api_object, None
+        if api_object is not None:
+            self.hass.async_create_task(api_object.async_close())
+
     async def async_step_otp_input(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -98,24 +217,34 @@ class _WithOTPInput(FlowHandler, ABC):
 
         if user_input:
             request_new_otp_code = user_input.get(CONF_REQUEST_NEW_OTP_CODE)
-            if request_new_otp_code or time() < otp_expires_at:
-                try:
-                    async with PikComfortAPI(
+            if request_new_otp_code or (
+                otp_expires_at is not None and time() < otp_expires_at
+            ):
+                # Reuse the session across code re-requests and retries
+                api_object = self._api_object
+                if api_object is None or api_object.session.closed:
+                    api_object = PikComfortAPI(
                         username=phone_number,
                         device_name=self._device_name,
-                    ) as api_object:
-                        if request_new_otp_code:
-                            await self._async_request_otp_code(api_object)
-                        else:
-                            await api_object.async_authenticate_otp(
-                                user_input[CONF_OTP_CODE]
-                            )
-                            self._auth_token = api_object.token
-                            return self._create_entry()
-                except BaseException as error:
-                    intl_error_string, error_message, error_code = _handle_exception(
-                        phone_number, error
                     )
+                    self._api_object = api_object
+
+                try:
+                    if request_new_otp_code:
+                        await self._async_request_otp_code(api_object)
+                    else:
+                        await api_object.async_authenticate_otp(
+                            user_input[CONF_OTP_CODE]
+                        )
+                        self._auth_token = api_object.token
+                        await self._async_close_api_object()
+                        return self._create_entry()
+                except BaseException as error:
+                    (
+                        intl_error_string,
+                        error_message,
+                        error_code,
+                    ) = self._handle_exception(error)
                     if intl_error_string == "server_error" and error_code == "invalid":
                         errors[CONF_OTP_CODE] = "otp_token_invalid"
                     else:
@@ -125,17 +254,10 @@ class _WithOTPInput(FlowHandler, ABC):
 
         return self.async_show_form(
             step_id="otp_input",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_OTP_CODE): cv.string,
-                    vol.Optional(CONF_REQUEST_NEW_OTP_CODE, default=False): cv.boolean,
-                }
-            ),
+            data_schema=OTP_INPUT_SCHEMA,
             description_placeholders={
-                "will_expire_at": as_local(
-                    datetime.fromtimestamp(otp_expires_at)
-                ).isoformat(),
-                "phone_number": _format_phone_number(phone_number),
+                "will_expire_at": self._otp_expires_at_text or "<?>",
+                "phone_number": self._formatted_phone_number,
                 "error_code": error_code or "<?>",
                 "error_message": error_message or "<?>",
             },
@@ -144,29 +266,44 @@ class _WithOTPInput(FlowHandler, ABC):
 
     async def _async_request_otp_code(self, api_object: PikComfortAPI) -> None:
         ttl = await api_object.async_request_otp_code()
-        self._otp_expires_at = time() + ttl
+        otp_expires_at = time() + ttl
+        self._otp_expires_at = otp_expires_at
+        self._otp_expires_at_text = as_local(
+            datetime.fromtimestamp(otp_expires_at)
+        ).isoformat()
 
     async def _async_test_authentication(self) -> Dict[str, Any]:
         phone_number, auth_token = self._phone_number, self._auth_token
-        log_prefix = f"[{mask_username(phone_number)}] "
+        log_prefix = self._log_prefix
+
+        await self._async_close_api_object()
+        api_object = PikComfortAPI(
+            username=phone_number,
+            token=auth_token,
+            device_name=self._device_name,
+        )
+        self._api_object = api_object
 
-        async with PikComfortAPI(username=phone_number, token=auth_token) as api_object:
+        try:
             if not api_object.is_authenticated:
-                _LOGGER.debug(
-                    f"[{mask_username(phone_number)}] "
-                    f"Попытка запроса кода подтверждения СМС"
-                )
+                _LOGGER.debug("%sПопытка запроса кода подтверждения СМС", log_prefix)
 
                 await self._async_request_otp_code(api_object)
+                # Session is kept open for the OTP input step
                 return await self.async_step_otp_input()
 
             _LOGGER.debug(
-                log_prefix + "Попытка авторизации с помощью "
-                "введённого токена авторизации"
+                "%sПопытка авторизации с помощью введённого токена авторизации",
+                log_prefix,
             )
-            await api_object.async_update_info()
+            await api_object.async_validate_token()
+        except BaseException:
+            await self._async_close_api_object()
+            raise
 
-        _LOGGER.debug(log_prefix + "Авторизация успешна, сохранение данных")
+        await self._async_close_api_object()
+
+        _LOGGER.debug("%sАвторизация успешна, сохранение данных", log_prefix)
 
         return self._create_entry()
 
@@ -176,18 +313,13 @@ class PikComfortConfigFlow(ConfigFlow, _WithOTPInput, domain=DOMAIN):
 
     VERSION: ClassVar[int] = 4
 
-    def __init__(self) -> None:
-        super().__init__()
-
-        self._api_object: Optional[PikComfortAPI] = None
-
     def _create_entry(self) -> Dict[str, Any]:
         phone_number, auth_token = self._phone_number, self._auth_token
         assert auth_token is not None, "Auth token not filled"
         assert phone_number is not None, "Phone number not filled"
 
         return self.async_create_entry(
-            title=_format_phone_number(phone_number),
+            title=self._formatted_phone_number,
             data={
                 CONF_PHONE_NUMBER: phone_number,
                 CONF_TOKEN: auth_token,
@@ -199,56 +331,51 @@ class PikComfortConfigFlow(ConfigFlow, _WithOTPInput, domain=DOMAIN):
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        errors = {}
-        error_code = None
-        error_message = None
-
-        if user_input:
-            phone_number = re.sub(r"\D", "", user_input[CONF_PHONE_NUMBER])
+        errors: Optional[Dict[str, str]] = None
+        description_placeholders: Optional[Dict[str, str]] = None
 
-            if len(phone_number) == 13 and phone_number[:2] == "00":
-                phone_number = phone_number[2:]
+        if self._device_name is None:
+            self._device_name = get_random_device_name()
 
-            if len(phone_number) == 10:
-                phone_number = "7" + phone_number
-            elif len(phone_number) == 11 and phone_number[0] == "8":
-                phone_number = "7" + phone_number[1:]
+        if user_input:
+            digits = user_input[CONF_PHONE_NUMBER].translate(DIGITS_ONLY_TABLE)
+            phone_number = _canonicalize_phone_number(digits)
 
-            if len(phone_number) != 11 or phone_number[0] != "7":
-                _LOGGER.error(f"Неправильный номер телефона: {phone_number}")
-                errors[CONF_PHONE_NUMBER] = "phone_number_invalid"
+            if phone_number is None:
+                _LOGGER.error("Неправильный номер телефона: %s", digits)
+                errors = {CONF_PHONE_NUMBER: "phone_number_invalid"}
             else:
                 self._device_name = user_input[CONF_DEVICE_NAME]
                 self._auth_token = (user_input.get(CONF_TOKEN) or "").strip() or None
-                self._phone_number = phone_number
+                self._set_phone_number(phone_number)
 
                 try:
                     return await self._async_test_authentication()
                 except BaseException as error:
-                    errors[CONF_BASE], error_message, error_code = _handle_exception(
-                        phone_number, error
-                    )
+                    (
+                        intl_error_string,
+                        error_message,
+                        error_code,
+                    ) = self._handle_exception(error)
+                    errors = {CONF_BASE: intl_error_string}
+                    description_placeholders = {
+                        "error_code": error_code,
+                        "error_message": error_message,
+                    }
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
+            data_schema=_add_suggested_values_to_schema(
+                USER_SCHEMA,
                 {
-                    vol.Required(
-                        CONF_PHONE_NUMBER,
-                        default=(user_input or {}).get(CONF_PHONE_NUMBER),
-                    ): cv.string,
-                    vol.Optional(CONF_TOKEN): str,
-                    vol.Required(
-                        CONF_DEVICE_NAME,
-                        default=self._device_name,
-                    ): vol.All(cv.string, vol.Length(min=3)),
-                }
+                    CONF_PHONE_NUMBER: (
+                        user_input.get(CONF_PHONE_NUMBER) if user_input else None
+                    ),
+                    CONF_DEVICE_NAME: self._device_name,
+                },
             ),
             errors=errors,
-            description_placeholders={
-                "error_code": error_code,
-                "error_message": error_message,
-            },
+            description_placeholders=description_placeholders,
         )
 
     @staticmethod
@@ -262,10 +389,10 @@ class PikComfortOptionsFlow(OptionsFlow, _WithOTPInput):
     def __init__(self, config_entry: ConfigEntry) -> None:
         super().__init__()
 
-        data = ChainMap(config_entry.data, config_entry.options)
+        data = {**config_entry.data, **config_entry.options}
 
         self._device_name: str = data[CONF_DEVICE_NAME]
-        self._phone_number: str = data[CONF_PHONE_NUMBER]
+        self._set_phone_number(data[CONF_PHONE_NUMBER])
         self._auth_token: str = data[CONF_TOKEN]
         self._scan_interval: float = data[CONF_SCAN_INTERVAL]
 
@@ -282,21 +409,23 @@ class PikComfortOptionsFlow(OptionsFlow, _WithOTPInput):
     async def async_step_init(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        errors = {}
-        description_placeholders = {}
+        errors: Optional[Dict[str, str]] = None
+        description_placeholders: Optional[Dict[str, Any]] = None
 
         if user_input:
             auth_token = user_input[CONF_TOKEN]
 
-            self._scan_interval = user_input[CONF_SCAN_INTERVAL].total_seconds()
+            scan_interval = user_input.get(CONF_SCAN_INTERVAL)
+            if scan_interval is not None:
+                self._scan_interval = scan_interval.total_seconds()
             self._device_name = user_input[CONF_DEVICE_NAME]
             self._auth_token = (
                 None if user_input.get(CONF_REQUEST_NEW_TOKEN) else auth_token
             )
 
             if self._scan_interval < MIN_SCAN_INTERVAL:
-                errors[CONF_SCAN_INTERVAL] = "scan_interval_too_low"
-                description_placeholders["min_scan_interval"] = MIN_SCAN_INTERVAL
+                errors = {CONF_SCAN_INTERVAL: "scan_interval_too_low"}
+                description_placeholders = {"min_scan_interval": MIN_SCAN_INTERVAL}
 
             else:
 
@@ -304,38 +433,37 @@ class PikComfortOptionsFlow(OptionsFlow, _WithOTPInput):
                     return await self._async_test_authentication()
                 except BaseException as error:
                     (
-                        errors[CONF_BASE],
-                        description_placeholders["error_message"],
-                        description_placeholders["error_code"],
-                    ) = _handle_exception(self._phone_number, error)
+                        intl_error_string,
+                        error_message,
+                        error_code,
+                    ) = self._handle_exception(error)
+                    errors = {CONF_BASE: intl_error_string}
+                    description_placeholders = {
+                        "error_code": error_code,
+                        "error_message": error_message,
+                    }
 
             self._auth_token = auth_token
         else:
             auth_token = self._auth_token
 
         scan_interval = self._scan_interval
-        hours = scan_interval // 3600
-        minutes = (scan_interval % 3600) // 60
-        seconds = scan_interval % 60
+        hours, remainder = divmod(scan_interval, 3600)
+        minutes, seconds = divmod(remainder, 60)
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
+            data_schema=_add_suggested_values_to_schema(
+                OPTIONS_SCHEMA,
                 {
-                    vol.Required(CONF_TOKEN, default=auth_token): cv.string,
-                    vol.Required(CONF_DEVICE_NAME, default=self._device_name): vol.All(
-                        cv.string, vol.Length(min=3)
-                    ),
-                    vol.Optional(
-                        CONF_SCAN_INTERVAL,
-                        default={
-                            "hours": hours,
-                            "minutes": minutes,
-                            "seconds": seconds,
-                        },
-                    ): cv.positive_time_period_dict,
-                    vol.Optional(CONF_REQUEST_NEW_TOKEN, default=False): cv.boolean,
-                }
+                    CONF_TOKEN: auth_token,
+                    CONF_DEVICE_NAME: self._device_name,
+                    CONF_SCAN_INTERVAL: {
+                        "hours": hours,
+                        "minutes": minutes,
+                        "seconds": seconds,
+                    },
+                },
             ),
             errors=errors,
             description_placeholders=description_placeholders,
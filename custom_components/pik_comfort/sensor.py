@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from itertools import chain
-from typing import Any, Dict, List, Mapping, Optional, Type, TypeVar
+from typing import Any, Dict, Final, List, Mapping, Optional, Tuple, Type, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ATTRIBUTION, STATE_UNAVAILABLE
@@ -22,6 +22,23 @@ from custom_components.pik_comfort.const import ATTRIBUTION, DATA_ENTITIES
 
 _TBasePikComfortEntity = TypeVar("_TBasePikComfortEntity", bound=BasePikComfortEntity)
 
+PAYMENT_STATUS_ICONS: Final[Dict[PaymentStatus, str]] = {
+    PaymentStatus.ACCEPTED: "mdi:cash-check",
+    PaymentStatus.DECLINED: "mdi:cash-remove",
+}
+
+TICKET_STATUS_ICONS: Final[Dict[Tuple[TicketStatus, bool], str]] = {
+    (status, is_viewed): (icon + "-outline" if is_viewed else icon)
+    for status, icon in {
+        TicketStatus.RECEIVED: "mdi:comment-processing",
+        TicketStatus.DENIED: "mdi:comment-remove",
+        TicketStatus.PROCESSING: "mdi:comment-arrow-right",
+        TicketStatus.COMPLETED: "mdi:comment-check",
+        TicketStatus.UNKNOWN: "mdi:comment-question",
+    }.items()
+    for is_viewed in (False, True)
+}
+
 
 async def async_process_update(
     hass: HomeAssistantType, config_entry_id: str, async_add_entities
@@ -29,88 +46,77 @@ async def async_process_update(
     api_object: PikComfortAPI = hass.data[DOMAIN][config_entry_id]
 
     new_entities = []
-    remove_tasks = []
+    remove_coroutines = []
 
     # Retrieve entities with their types
     entities: Dict[
         Type[_TBasePikComfortEntity], List[_TBasePikComfortEntity]
     ] = hass.data[DATA_ENTITIES][config_entry_id]
 
-    last_payment_entities = entities.get(PikComfortLastPaymentSensor, [])
-    old_last_payment_entities = list(last_payment_entities)
-
-    last_receipt_entities = entities.get(PikComfortLastReceiptSensor, [])
-    old_last_receipt_entities = list(last_receipt_entities)
-
-    ticket_entities = entities.get(PikComfortTicketSensor, [])
-    old_ticket_entities = list(ticket_entities)
+    remaining_last_payment_entities = {
+        (entity.account_type, entity.account_id): entity
+        for entity in entities.get(PikComfortLastPaymentSensor, [])
+    }
+    remaining_last_receipt_entities = {
+        (entity.account_type, entity.account_id): entity
+        for entity in entities.get(PikComfortLastReceiptSensor, [])
+    }
+    remaining_ticket_entities = {
+        (entity.ticket_type, entity.ticket_id): entity
+        for entity in entities.get(PikComfortTicketSensor, [])
+    }
 
     # Process accounts
     for account in api_object.info.accounts:
         # Process last payment per account
         account_key = (account.type, account.id)
-        existing_entity = None
-
-        for entity in last_payment_entities:
-            if (entity.account_type, entity.account_id) == account_key:
-                existing_entity = entity
-                old_last_payment_entities.remove(entity)
-                break
+        existing_entity = remaining_last_payment_entities.pop(account_key, None)
 
         if existing_entity is None:
             new_entities.append(
                 PikComfortLastPaymentSensor(config_entry_id, *account_key)
             )
         else:
-            existing_entity.async_schedule_update_ha_state(force_refresh=False)
+            existing_entity.async_write_ha_state()
 
         # Process last receipt per account
         # key is the same
-        existing_entity = None
-        for entity in last_receipt_entities:
-            if (entity.account_type, entity.account_id) == account_key:
-                existing_entity = entity
-                old_last_receipt_entities.remove(entity)
-                break
+        existing_entity = remaining_last_receipt_entities.pop(account_key, None)
 
         if existing_entity is None:
             new_entities.append(
                 PikComfortLastReceiptSensor(config_entry_id, *account_key)
             )
         else:
-            existing_entity.async_schedule_update_ha_state(force_refresh=False)
+            existing_entity.async_write_ha_state()
 
         # Process tickets per account
         for ticket in account.tickets:
             ticket_key = (ticket.type, ticket.id)
-            existing_entity = None
-
-            for entity in ticket_entities:
-                if (entity.ticket_type, entity.ticket_id) == ticket_key:
-                    existing_entity = entity
-                    old_ticket_entities.remove(existing_entity)
-                    break
+            existing_entity = remaining_ticket_entities.pop(ticket_key, None)
 
             if existing_entity is None:
                 new_entities.append(
                     PikComfortTicketSensor(config_entry_id, *account_key, *ticket_key)
                 )
             else:
-                existing_entity.async_schedule_update_ha_state(force_refresh=False)
+                existing_entity.async_write_ha_state()
 
     for entity in chain(
-        old_ticket_entities,
-        old_last_payment_entities,
-        old_last_receipt_entities,
+        remaining_ticket_entities.values(),
+        remaining_last_payment_entities.values(),
+        remaining_last_receipt_entities.values(),
     ):
-        _LOGGER.debug(f"Scheduling entity {entity} for removal")
-        remove_tasks.append(hass.async_create_task(entity.async_remove()))
+        _LOGGER.debug("Scheduling entity %s for removal", entity)
+        remove_coroutines.append(entity.async_remove())
 
     if new_entities:
         async_add_entities(new_entities, False)
 
-    if remove_tasks:
-        await asyncio.wait(remove_tasks, return_when=asyncio.ALL_COMPLETED)
+    if remove_coroutines:
+        for result in await asyncio.gather(*remove_coroutines, return_exceptions=True):
+            if isinstance(result, BaseException):
+                _LOGGER.error("Error removing entity: %s", result, exc_info=result)
 
 
 async def async_setup_entry(
@@ -130,6 +136,13 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class PikComfortLastPaymentSensor(BasePikComfortEntity):
+    def __init__(
+        self, config_entry_id: str, account_type: str, account_id: str
+    ) -> None:
+        super().__init__(config_entry_id, account_type, account_id)
+
+        self._unique_id = f"last_payment__{account_type}__{account_id}"
+
     @property
     def icon(self) -> str:
         account_object = self.account_object
@@ -138,10 +151,7 @@ class PikComfortLastPaymentSensor(BasePikComfortEntity):
             last_payment = account_object.last_payment
 
             if last_payment is not None:
-                if last_payment.status == PaymentStatus.ACCEPTED:
-                    return "mdi:cash-check"
-                elif last_payment.status == PaymentStatus.DECLINED:
-                    return "mdi:cash-remove"
+                return PAYMENT_STATUS_ICONS.get(last_payment.status, "mdi:cash")
 
         return "mdi:cash"
 
@@ -160,10 +170,6 @@ class PikComfortLastPaymentSensor(BasePikComfortEntity):
 
         return f"Last Payment {account_id}"
 
-    @property
-    def unique_id(self) -> str:
-        return f"last_payment__{self.account_type}__{self.account_id}"
-
     @property
     def available(self) -> bool:
         account_object = self.account_object
@@ -183,13 +189,14 @@ class PikComfortLastPaymentSensor(BasePikComfortEntity):
 
     @property
     def device_state_attributes(self) -> Optional[Mapping[str, Any]]:
-        last_payment = self.account_object.last_payment
+        account_object = self.account_object
+        if account_object is None:
+            return None
 
+        last_payment = account_object.last_payment
         if last_payment is None:
             return None
 
-        account_object = self.account_object
-
         return {
             "amount": last_payment.amount,
             "status_id": last_payment.status_id,
@@ -220,6 +227,7 @@ class PikComfortTicketSensor(BasePikComfortEntity):
 
         self.ticket_type: str = ticket_type
         self.ticket_id: str = ticket_id
+        self._unique_id = f"ticket__{ticket_type}__{ticket_id}"
 
     @property
     def _ticket_object(self) -> Optional[PikComfortTicket]:
@@ -227,17 +235,7 @@ class PikComfortTicketSensor(BasePikComfortEntity):
         if not info:
             return None
 
-        key = (self.ticket_type, self.ticket_id)
-        for account in info.accounts:
-            for ticket in account.tickets:
-                if (ticket.type, ticket.id) == key:
-                    return ticket
-
-        return None
-
-    @property
-    def unique_id(self) -> str:
-        return f"ticket__{self.ticket_type}__{self.ticket_id}"
+        return info.get_ticket(self.ticket_type, self.ticket_id)
 
     @property
     def available(self) -> bool:
@@ -251,24 +249,10 @@ class PikComfortTicketSensor(BasePikComfortEntity):
     def icon(self) -> str:
         ticket_object = self._ticket_object
 
-        suffix = ""
-        if ticket_object is not None:
-            if ticket_object.is_viewed:
-                suffix = "-outline"
-
-            status = ticket_object.status
-            if status == TicketStatus.RECEIVED:
-                return "mdi:comment-processing" + suffix
-            elif status == TicketStatus.DENIED:
-                return "mdi:comment-remove" + suffix
-            elif status == TicketStatus.PROCESSING:
-                return "mdi:comment-arrow-right" + suffix
-            elif status == TicketStatus.COMPLETED:
-                return "mdi:comment-check" + suffix
-            elif status == TicketStatus.UNKNOWN:
-                return "mdi:comment-question" + suffix
-
-        return "mdi:chat" + suffix
+        if ticket_object is None:
+            return "mdi:chat"
+
+        return TICKET_STATUS_ICONS[ticket_object.status, bool(ticket_object.is_viewed)]
 
     @property
     def name(self) -> str:
@@ -315,6 +299,13 @@ class PikComfortTicketSensor(BasePikComfortEntity):
 
 
 class PikComfortLastReceiptSensor(BasePikComfortEntity):
+    def __init__(
+        self, config_entry_id: str, account_type: str, account_id: str
+    ) -> None:
+        super().__init__(config_entry_id, account_type, account_id)
+
+        self._unique_id = f"last_receipt__{account_type}__{account_id}"
+
     @property
     def icon(self) -> str:
         account_object = self.account_object
@@ -343,10 +334,6 @@ class PikComfortLastReceiptSensor(BasePikComfortEntity):
         )
         return f"Last Receipt {account_id}"
 
-    @property
-    def unique_id(self) -> str:
-        return f"last_receipt__{self.account_type}__{self.account_id}"
-
     @property
     def available(self) -> bool:
         account_object = self.account_object
@@ -367,13 +354,14 @@ class PikComfortLastReceiptSensor(BasePikComfortEntity):
 
     @property
     def device_state_attributes(self) -> Optional[Mapping[str, Any]]:
-        last_receipt = self.account_object.last_receipt
+        account_object = self.account_object
+        if account_object is None:
+            return None
 
+        last_receipt = account_object.last_receipt
         if last_receipt is None:
             return None
 
-        account_object = self.account_object
-
         return {
             "type": last_receipt.type,
             "period": last_receipt.period.isoformat(),